@@ -611,7 +611,7 @@ class ApprovalViewSet(UserActionLoggingViewset, KeyValueListMixin):
     @basic_exception_handler
     def comms_log(self, request, *args, **kwargs):
         instance = self.get_object()
-        qs = instance.comms_logs.all()
+        qs = instance.comms_logs.prefetch_related("documents")
         serializer = ApprovalLogEntrySerializer(qs, many=True)
         return Response(serializer.data)
 
@@ -651,7 +651,11 @@ class ApprovalViewSet(UserActionLoggingViewset, KeyValueListMixin):
     )
     def invoices(self, request, *args, **kwargs):
         instance = self.get_object()
-        qs = instance.invoices.all()
+        qs = instance.invoices.select_related(
+            "approval__approval_type",
+            "approval__current_proposal__org_applicant",
+            "oracle_code",
+        ).with_balance()
         serializer = InvoiceSerializer(qs, many=True, context={"request": request})
         return Response(serializer.data)
 
@@ -62,8 +62,8 @@ def update_approval_doc_filename(instance, filename):
 
 def update_approval_comms_log_filename(instance, filename):
     return "proposals/{}/approvals/{}/communications/{}".format(
-        instance.log_entry.approval.current_proposal.id,
-        instance.log_entry.approval.id,
+        instance.log_entry.approval.current_proposal_id,
+        instance.log_entry.approval_id,
         filename,
     )
 
@@ -482,7 +482,7 @@ class Approval(LicensingModelVersioned):
 
         renewal_conditions = {
             "previous_application": self.current_proposal,
-            "proposal_type": ProposalType.objects.get(code=PROPOSAL_TYPE_RENEWAL),
+            "proposal_type__code": PROPOSAL_TYPE_RENEWAL,
         }
         return Proposal.objects.filter(**renewal_conditions).exists()
 
@@ -490,7 +490,7 @@ class Approval(LicensingModelVersioned):
     def active_renewal(self):
         renewal_conditions = {
             "previous_application": self.current_proposal,
-            "proposal_type": ProposalType.objects.get(code=PROPOSAL_TYPE_RENEWAL),
+            "proposal_type__code": PROPOSAL_TYPE_RENEWAL,
         }
         renewal_proposal = Proposal.objects.filter(**renewal_conditions).first()
         if not renewal_proposal:
@@ -504,7 +504,7 @@ class Approval(LicensingModelVersioned):
     def has_draft_amendment(self):
         amendment_conditions = {
             "previous_application": self.current_proposal,
-            "proposal_type": ProposalType.objects.get(code=PROPOSAL_TYPE_AMENDMENT),
+            "proposal_type__code": PROPOSAL_TYPE_AMENDMENT,
         }
         return Proposal.objects.filter(**amendment_conditions).exists()
 
@@ -512,7 +512,7 @@ class Approval(LicensingModelVersioned):
     def active_amendment(self):
         amendment_conditions = {
             "previous_application": self.current_proposal,
-            "proposal_type": ProposalType.objects.get(code=PROPOSAL_TYPE_AMENDMENT),
+            "proposal_type__code": PROPOSAL_TYPE_AMENDMENT,
         }
         amendment_proposal = Proposal.objects.filter(**amendment_conditions).first()
         if not amendment_proposal:
@@ -607,7 +607,7 @@ class Approval(LicensingModelVersioned):
 
         renewal_conditions = {
             "previous_application": self.current_proposal,
-            "proposal_type": ProposalType.objects.get(code=PROPOSAL_TYPE_RENEWAL),
+            "proposal_type__code": PROPOSAL_TYPE_RENEWAL,
         }
         return not Proposal.objects.filter(**renewal_conditions).exists()
 
@@ -641,7 +641,7 @@ class Approval(LicensingModelVersioned):
         else:
             amend_conditions = {
                 "previous_application": self.current_proposal,
-                "proposal_type": ProposalType.objects.get(code=PROPOSAL_TYPE_AMENDMENT),
+                "proposal_type__code": PROPOSAL_TYPE_AMENDMENT,
             }
             proposals = Proposal.objects.filter(**amend_conditions)
             if proposals:
@@ -780,18 +780,21 @@ class Approval(LicensingModelVersioned):
     def reinstate_discarded_invoices(self):
         # Method to use when reinstating a cancelled or surrendered approval
         # Reinstates all discarded invoices for the approval
-        reinstated_invoice_count = self.invoices.filter(
+        discarded_invoices = self.invoices.filter(
             status=Invoice.INVOICE_STATUS_DISCARDED,
-        ).count()
-        for invoice in self.invoices.filter(
-            status=Invoice.INVOICE_STATUS_DISCARDED,
-        ):
-            if not invoice.date_due:
-                invoice.status = Invoice.INVOICE_STATUS_PENDING_UPLOAD_ORACLE_INVOICE
-                invoice.save()
-            else:
-                invoice.status = Invoice.INVOICE_STATUS_UNPAID
-                invoice.save()
+        )
+        reinstated_invoice_count = discarded_invoices.filter(
+            date_due__isnull=True
+        ).update(
+            status=Invoice.INVOICE_STATUS_PENDING_UPLOAD_ORACLE_INVOICE,
+            datetime_updated=timezone.now(),
+        )
+        reinstated_invoice_count += discarded_invoices.filter(
+            date_due__isnull=False
+        ).update(
+            status=Invoice.INVOICE_STATUS_UNPAID,
+            datetime_updated=timezone.now(),
+        )
 
         logger.info(
             f"Reinstated {reinstated_invoice_count} discarded invoices for Approval: {self}"
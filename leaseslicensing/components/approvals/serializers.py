@@ -354,11 +354,13 @@ class ApprovalSerializer(serializers.ModelSerializer):
         return obj.holder
 
     def get_applicant_type(self, obj):
-        if isinstance(obj.applicant, Organisation):
+        # The applicant is resolved (and for individuals queried) on every access
+        applicant = obj.applicant
+        if isinstance(applicant, Organisation):
             return "organisation"
-        elif isinstance(obj.applicant, ProposalApplicant):
+        elif isinstance(applicant, ProposalApplicant):
             return "individual"
-        elif isinstance(obj.applicant, EmailUser):
+        elif isinstance(applicant, EmailUser):
             return "individual"
         else:
             return "Applicant not yet assigned"
@@ -367,9 +369,10 @@ class ApprovalSerializer(serializers.ModelSerializer):
         return obj.applicant_id
 
     def get_holder_obj(self, obj):
-        if isinstance(obj.applicant, Organisation):
-            return OrganisationSerializer(obj.applicant).data
-        return UserSerializer(obj.applicant).data
+        applicant = obj.applicant
+        if isinstance(applicant, Organisation):
+            return OrganisationSerializer(applicant).data
+        return UserSerializer(applicant).data
 
     def get_can_renew(self, obj):
         if not obj.can_renew:
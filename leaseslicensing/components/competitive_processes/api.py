@@ -273,7 +273,7 @@ class CompetitiveProcessViewSet(UserActionLoggingViewset, Select2ListMixin):
     @basic_exception_handler
     def comms_log(self, request, *args, **kwargs):
         instance = self.get_object()
-        qs = instance.comms_logs.all()
+        qs = instance.comms_logs.prefetch_related("documents")
         serializer = CompetitiveProcessLogEntrySerializer(qs, many=True)
         return Response(serializer.data)
 
@@ -584,7 +584,7 @@ class PartyDetailDocument(Document):
 
 def update_competitive_process_comms_log_filename(instance, filename):
     return "{}/competitive_process/{}/communications/{}".format(
-        settings.MEDIA_APP_DIR, instance.log_entry.competitive_process.id, filename
+        settings.MEDIA_APP_DIR, instance.log_entry.competitive_process_id, filename
     )
 
 
@@ -3,7 +3,6 @@ from copy import deepcopy
 from datetime import datetime
 
 from django.conf import settings
-from django.core.files.base import ContentFile
 from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUploadedFile
 from django.db import transaction
 from django.db.models import F, Q
@@ -385,7 +384,7 @@ class ComplianceViewSet(UserActionLoggingViewset):
                 document = instance.documents.get_or_create(name=filename)[0]
                 path = upload_protected_files_storage.save(
                     update_proposal_compliance_filename(document, filename),
-                    ContentFile(_file.read()),
+                    _file,
                 )
                 document._file = path
                 document.save()
@@ -417,7 +416,7 @@ class ComplianceViewSet(UserActionLoggingViewset):
             document = instance.documents.get_or_create(name=filename)[0]
             path = upload_protected_files_storage.save(
                 update_proposal_compliance_filename(document, filename),
-                ContentFile(_file.read()),
+                _file,
             )
             document._file = path
             document.save()
@@ -538,7 +537,7 @@ class ComplianceViewSet(UserActionLoggingViewset):
     @basic_exception_handler
     def comms_log(self, request, *args, **kwargs):
         instance = self.get_object()
-        qs = instance.comms_logs.all()
+        qs = instance.comms_logs.prefetch_related("documents")
         serializer = ComplianceCommsSerializer(qs, many=True)
         return Response(serializer.data)
 
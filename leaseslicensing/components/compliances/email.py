@@ -666,7 +666,7 @@ def _log_compliance_email(email_message, compliance, sender=None):
 
     staff = sender
 
-    if type(staff) is not int:
+    if not isinstance(staff, int):
         if not hasattr(staff, "id"):
             raise ValueError("staff must be an int (i.e. EmailUser.id)")
         staff = staff.id
@@ -723,12 +723,12 @@ def _log_org_email(email_message, organisation, customer, sender=None):
 
     staff = sender
 
-    if type(staff) is not int:
+    if not isinstance(staff, int):
         if not hasattr(staff, "id"):
             raise ValueError("staff must be an int (i.e. EmailUser.id)")
         staff = staff.id
 
-    if customer is not None and type(customer) is not int:
+    if customer is not None and not isinstance(customer, int):
         if not hasattr(customer, "id"):
             raise ValueError("customer must be an int (i.e. EmailUser.id)")
         customer = customer.id
@@ -787,12 +787,12 @@ def _log_user_email(email_message, emailuser, customer, sender=None):
 
     staff = sender
 
-    if type(staff) is not int:
+    if not isinstance(staff, int):
         if not hasattr(staff, "id"):
             raise ValueError("staff must be an int (i.e. EmailUser.id)")
         staff = staff.id
 
-    if type(customer) is not int:
+    if not isinstance(customer, int):
         if not hasattr(customer, "id"):
             raise ValueError("customer must be an int (i.e. EmailUser.id)")
         customer = customer.id
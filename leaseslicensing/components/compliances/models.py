@@ -533,7 +533,7 @@ class ComplianceLogEntry(CommunicationsLogEntry):
 
 def update_compliance_comms_log_filename(instance, filename):
     return "proposals/{}/compliance/communications/{}".format(
-        instance.log_entry.compliance.proposal.id, filename
+        instance.log_entry.compliance.proposal_id, filename
     )
 
 
@@ -1,16 +1,16 @@
 import logging
-from datetime import datetime
-from decimal import Decimal
+from datetime import date
 
 import requests
 from django.conf import settings
 from django.db import transaction
 from django.db.models import Q
-from django.http import FileResponse, Http404
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils import timezone
 from ledger_api_client.utils import generate_payment_session
+from requests.adapters import HTTPAdapter
 from rest_framework import mixins, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
@@ -18,6 +18,8 @@ from rest_framework.response import Response
 from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
 from rest_framework.views import APIView
 from rest_framework_datatables.filters import DatatablesFilterBackend
+from rest_framework_datatables.utils import get_param
+from urllib3.util.retry import Retry
 
 from leaseslicensing.components.approvals.models import ApprovalUserAction
 from leaseslicensing.components.approvals.serializers import ApprovalSerializer
@@ -26,6 +28,7 @@ from leaseslicensing.components.invoicing.email import (
     send_invoice_paid_internal_notification,
 )
 from leaseslicensing.components.invoicing.models import (
+    DECIMAL_ZERO,
     CPICalculationMethod,
     Invoice,
     InvoiceTransaction,
@@ -48,11 +51,37 @@ from leaseslicensing.components.main.api import (
     NoPaginationListMixin,
 )
 from leaseslicensing.components.organisations.utils import get_organisation_ids_for_user
-from leaseslicensing.helpers import is_customer, is_finance_officer
+from leaseslicensing.helpers import is_customer, is_finance_officer, today
 from leaseslicensing.permissions import IsAssessor, IsFinanceOfficer
 
 logger = logging.getLogger(__name__)
 
+# Reuse connections to ledger across requests rather than paying for a new
+# TCP + TLS handshake every time a receipt is retrieved
+ledger_session = requests.Session()
+ledger_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+)
+ledger_session.mount("http://", ledger_adapter)
+ledger_session.mount("https://", ledger_adapter)
+
+INVOICE_STATUSES = [
+    {"id": status[0], "name": status[1]} for status in Invoice.INVOICE_STATUS_CHOICES
+]
+
+CUSTOMER_INVOICE_STATUSES = [
+    status
+    for status in INVOICE_STATUSES
+    if status["id"]
+    not in [
+        Invoice.INVOICE_STATUS_PENDING_UPLOAD_ORACLE_INVOICE,
+        Invoice.INVOICE_STATUS_VOID,
+        Invoice.INVOICE_STATUS_DISCARDED,
+    ]
+]
+
 
 class InvoiceFilterBackend(DatatablesFilterBackend):
     def filter_queryset(self, request, queryset, view):
@@ -60,7 +89,11 @@ class InvoiceFilterBackend(DatatablesFilterBackend):
         if approval_id:
             queryset = queryset.filter(approval_id=approval_id)
 
-        total_count = queryset.count()
+        # The total count is only used by the datatables pagination class, which does
+        # not paginate requests for all rows (length=-1) so there is no need to count them
+        total_count = None
+        if self.check_renderer_format(request) and get_param(request, "length") != "-1":
+            total_count = queryset.count()
 
         filter_invoice_organisation = (
             request.GET.get("filter_invoice_organisation")
@@ -84,33 +117,28 @@ class InvoiceFilterBackend(DatatablesFilterBackend):
             if "overdue" == filter_invoice_status:
                 queryset = queryset.filter(
                     status=Invoice.INVOICE_STATUS_UNPAID,
-                    date_due__lte=datetime.now().date(),
+                    date_due__lte=today(),
                 )
             else:
                 queryset = queryset.filter(status=filter_invoice_status)
 
         if filter_invoice_due_date_from:
-            filter_invoice_due_date_from = datetime.strptime(
-                filter_invoice_due_date_from, "%Y-%m-%d"
+            filter_invoice_due_date_from = date.fromisoformat(
+                filter_invoice_due_date_from
             )
             queryset = queryset.filter(date_due__gte=filter_invoice_due_date_from)
 
         if filter_invoice_due_date_to:
-            filter_invoice_due_date_to = datetime.strptime(
-                filter_invoice_due_date_to, "%Y-%m-%d"
-            )
+            filter_invoice_due_date_to = date.fromisoformat(filter_invoice_due_date_to)
             queryset = queryset.filter(date_due__lte=filter_invoice_due_date_to)
 
-        fields = self.get_fields(request)
-        ordering = self.get_ordering(request, view, fields)
-        queryset = queryset.order_by(*ordering)
-        if len(ordering):
-            queryset = queryset.order_by(*ordering)
-
+        # Ordering (when requested) is applied by DatatablesFilterBackend.filter_queryset.
+        # It also stores the filtered count (the invoice filters above are already
+        # applied) on the view, which the pagination class reuses rather than counting
         queryset = super().filter_queryset(request, queryset, view)
 
-        setattr(view, "_datatables_filtered_count", queryset.count())
-        setattr(view, "_datatables_total_count", total_count)
+        if total_count is not None:
+            setattr(view, "_datatables_total_count", total_count)
 
         return queryset
 
@@ -122,12 +150,25 @@ class InvoiceViewSet(LicensingViewSet):
     search_fields = ["lodgement_number", "oracle_invoice_number"]
 
     def get_queryset(self):
+        # The serializer reads the approval type, holder and oracle code of every invoice
+        queryset = (
+            super()
+            .get_queryset()
+            .select_related(
+                "approval__approval_type",
+                "approval__current_proposal__org_applicant",
+                "approval__current_proposal__invoicing_details",
+                "oracle_code",
+            )
+        )
+        if self.action == "list":
+            queryset = queryset.with_balance()
         if is_customer(self.request):
             org_ids = get_organisation_ids_for_user(self.request.user.id)
             return (
-                super()
-                .get_queryset()
-                .exclude(status=Invoice.INVOICE_STATUS_PENDING_UPLOAD_ORACLE_INVOICE)
+                queryset.exclude(
+                    status=Invoice.INVOICE_STATUS_PENDING_UPLOAD_ORACLE_INVOICE
+                )
                 .exclude(invoice_pdf="")
                 .exclude(oracle_invoice_number__isnull=True)
                 .filter(
@@ -135,32 +176,19 @@ class InvoiceViewSet(LicensingViewSet):
                     | Q(approval__current_proposal__org_applicant__in=org_ids)
                 )
             )
-        return super().get_queryset()
+        return queryset
 
     @action(detail=False, methods=["get"])
     def statuses(self, request, *args, **kwargs):
-        status_choices = [
-            {"id": status[0], "name": status[1]}
-            for status in Invoice.INVOICE_STATUS_CHOICES
-        ]
         if is_customer(request):
-            status_choices = [
-                status
-                for status in status_choices
-                if status["id"]
-                not in [
-                    Invoice.INVOICE_STATUS_PENDING_UPLOAD_ORACLE_INVOICE,
-                    Invoice.INVOICE_STATUS_VOID,
-                    Invoice.INVOICE_STATUS_DISCARDED,
-                ]
-            ]
-        return Response(status_choices)
+            return Response(CUSTOMER_INVOICE_STATUSES)
+        return Response(INVOICE_STATUSES)
 
     @action(detail=True, methods=["get"])
     def transactions(self, request, *args, **kwargs):
         instance = self.get_object()
         serializer = InvoiceTransactionSerializer(
-            instance.transactions.all(), many=True
+            instance.transactions.with_running_balance(), many=True
         )
         return Response(serializer.data)
 
@@ -175,8 +203,8 @@ class InvoiceViewSet(LicensingViewSet):
 
         instance = self.get_object()
 
-        credit = request.data.get("credit", Decimal("0.00"))
-        debit = request.data.get("debit", Decimal("0.00"))
+        credit = request.data.get("credit", DECIMAL_ZERO)
+        debit = request.data.get("debit", DECIMAL_ZERO)
 
         serializer = InvoiceTransactionSerializer(
             data={
@@ -188,11 +216,15 @@ class InvoiceViewSet(LicensingViewSet):
         if not serializer.is_valid():
             return Response(serializer.errors, status=400)
 
-        invoice_transaction = serializer.save()
+        serializer.save()
 
-        if Decimal("0.00") == invoice_transaction.invoice.balance:
-            invoice_transaction.invoice.status = Invoice.INVOICE_STATUS_PAID
-            invoice_transaction.invoice.save()
+        # The balance is summed by the database so check it on the invoice being
+        # serialized below rather than on a second copy of the invoice
+        if DECIMAL_ZERO == instance.balance:
+            instance.status = Invoice.INVOICE_STATUS_PAID
+            Invoice.objects.filter(pk=instance.pk).update(
+                status=instance.status, datetime_updated=timezone.now()
+            )
 
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
@@ -254,21 +286,19 @@ class InvoiceViewSet(LicensingViewSet):
             days=settings.DEFAULT_DAYS_BEFORE_PAYMENT_DUE
         )
 
-        data = request.data.copy()
-        data.update(
-            {
-                "status": Invoice.INVOICE_STATUS_UNPAID,
-                "date_issued": date_issued,
-                "date_due": date_due,
-            }
+        serializer = InvoiceEditOracleInvoiceNumberSerializer(
+            instance, data=request.data
         )
 
-        serializer = InvoiceEditOracleInvoiceNumberSerializer(instance, data=data)
-
         if not serializer.is_valid():
             return Response(serializer.errors, status=400)
 
-        instance = serializer.save()
+        # Pass the system set values to save() rather than copying the (multipart) request data
+        instance = serializer.save(
+            status=Invoice.INVOICE_STATUS_UNPAID,
+            date_issued=date_issued,
+            date_due=date_due,
+        )
 
         instance.invoice_pdf = invoice_pdf
         instance.save()
@@ -320,14 +350,30 @@ class InvoiceViewSet(LicensingViewSet):
         instance = self.get_object()
         invoice_url = instance.ledger_invoice_url
         if invoice_url:
-            response = requests.get(invoice_url)
-            return FileResponse(response, content_type="application/pdf")
+            # Stream the pdf from ledger rather than loading it into memory first
+            response = ledger_session.get(invoice_url, stream=True, timeout=30)
+            if not response.ok:
+                logger.error(
+                    f"Failed to retrieve receipt for Invoice: {instance.lodgement_number} "
+                    f"from ledger. Status code: {response.status_code}"
+                )
+                response.close()
+                raise Http404
+
+            streaming_response = StreamingHttpResponse(
+                response.iter_content(chunk_size=64 * 1024),
+                content_type="application/pdf",
+            )
+            streaming_response["Content-Disposition"] = (
+                f'inline; filename="{instance.lodgement_number}.pdf"'
+            )
+            return streaming_response
 
         raise Http404
 
 
 class InvoiceTransactionViewSet(LicensingViewSet):
-    queryset = InvoiceTransaction.objects.all()
+    queryset = InvoiceTransaction.objects.with_running_balance()
     serializer_class = InvoiceTransactionSerializer
     permission_classes = [IsAssessor | IsFinanceOfficer]
 
@@ -348,28 +394,32 @@ class PayInvoiceSuccessCallbackView(APIView):
     def get(self, request, uuid, format=None):
         logger.info("Leases Licensing Pay Invoice Success View get method called.")
 
-        if (
-            uuid
-            and Invoice.objects.filter(
-                uuid=uuid, status=Invoice.INVOICE_STATUS_UNPAID
-            ).exists()
-        ):
+        invoice = None
+        if uuid:
             logger.info(
                 f"Looking for Invoice with uuid: {uuid}.",
             )
-            invoice = Invoice.objects.get(uuid=uuid)
+            # Lock the invoice row so concurrent callbacks can't mark the same invoice as paid twice
+            invoice = (
+                Invoice.objects.select_for_update(skip_locked=True, of=("self",))
+                .filter(uuid=uuid, status=Invoice.INVOICE_STATUS_UNPAID)
+                # The existing transactions of the invoice are not needed here
+                .prefetch_related(None)
+                .first()
+            )
 
+        if invoice:
             logger.info(
                 f"Found - Invoice: {invoice.id}",
             )
 
-            if invoice.amount > Decimal("0.00"):
+            if invoice.amount > DECIMAL_ZERO:
                 it = InvoiceTransaction.objects.create(
                     invoice=invoice,
                     debit=invoice.amount,
                 )
                 logger.info(f"Created Invoice Transaction: {it.id} Debit: {it.debit}")
-            elif invoice.amount < Decimal("0.00"):
+            elif invoice.amount < DECIMAL_ZERO:
                 it = InvoiceTransaction.objects.create(
                     invoice=invoice,
                     credit=invoice.amount,
@@ -377,8 +427,12 @@ class PayInvoiceSuccessCallbackView(APIView):
                 logger.info(f"Created Invoice Transaction: {it.id} Credit: {it.credit}")
 
             invoice.status = Invoice.INVOICE_STATUS_PAID
-            invoice.date_paid = timezone.now()
-            invoice.save()
+            invoice.date_paid = today()
+            Invoice.objects.filter(pk=invoice.pk).update(
+                status=invoice.status,
+                date_paid=invoice.date_paid,
+                datetime_updated=timezone.now(),
+            )
 
             logger.info(
                 f"Invoice: {invoice.id} - Marked as paid.",
@@ -388,12 +442,17 @@ class PayInvoiceSuccessCallbackView(APIView):
                 f"Sending notifications for Invoice: {invoice.id}.",
             )
 
-            send_invoice_paid_external_notification(invoice)
+            # Only send the notifications once the payment has actually been committed
+            transaction.on_commit(
+                lambda: send_invoice_paid_external_notification(invoice)
+            )
 
-            send_invoice_paid_internal_notification(invoice)
+            transaction.on_commit(
+                lambda: send_invoice_paid_internal_notification(invoice)
+            )
 
             logger.info(
-                f"Notifications sent for Invoice: {invoice.id}.",
+                f"Notifications queued for Invoice: {invoice.id}.",
             )
 
             logger.info(
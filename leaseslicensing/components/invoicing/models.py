@@ -7,18 +7,21 @@ from typing import Union
 
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
+from django.core.cache import cache
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models, transaction
-from django.db.models import F, Q, Sum, Window
+from django.db.models import F, Prefetch, Q, Sum, Window
 from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.forms import ValidationError
 from django.utils import timezone
+from django.utils.functional import cached_property
 from rest_framework import serializers
 
 from leaseslicensing import helpers
 from leaseslicensing.components.invoicing import utils
 from leaseslicensing.components.invoicing.email import (
-    send_new_invoice_raised_internal_notification,
     send_new_invoices_raised_internal_notification,
 )
 from leaseslicensing.components.main.models import (
@@ -29,6 +32,9 @@ from leaseslicensing.components.main.models import (
 
 logger = logging.getLogger(__name__)
 
+DECIMAL_ZERO = Decimal("0.00")
+DECIMAL_ONE_CENT = Decimal("0.01")
+
 
 class BaseModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, null=True)
@@ -84,25 +90,66 @@ class ConsumerPriceIndex(BaseModel):
         verbose_name = "CPI Data (Perth - All Groups)"
         verbose_name_plural = "CPI Data (Perth - All Groups)"
         ordering = ["-year", "-quarter"]
+        indexes = [
+            models.Index(fields=["quarter", "-year"], name="cpi_quarter_year_idx"),
+        ]
 
     def __str__(self):
         return f"{self.year}-Q{self.quarter}: {self.value}"
 
+    def save(self, *args, **kwargs):
+        # Remember the year and quarter the figure was stored under so that
+        # clear_cpi_cache also clears the cache entry of the original period
+        self._original_year_and_quarter = (
+            ConsumerPriceIndex.objects.filter(pk=self.pk)
+            .values_list("year", "quarter")
+            .first()
+            if self.pk
+            else None
+        )
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def get_by_year_and_quarter(
+        cls, year: int, quarter: int
+    ) -> Union["ConsumerPriceIndex", None]:
+        """CPI figures are looked up for every period of every invoice preview but
+        rarely change so they are cached (including the absence of a figure).
+        The cache entry is cleared by clear_cpi_cache."""
+        cache_key = settings.CACHE_KEY_CPI_BY_YEAR_AND_QUARTER.format(year, quarter)
+        cpi = cache.get(cache_key)
+        if cpi is None:
+            cpi = cls.objects.filter(year=year, quarter=quarter).first() or False
+            cache.set(cache_key, cpi, settings.CACHE_TIMEOUT_24_HOURS)
+        return cpi or None
+
+    @classmethod
+    def get_all_by_year_and_quarter(cls) -> dict:
+        return {(cpi.year, cpi.quarter): cpi for cpi in cls.objects.all()}
+
     @classmethod
     def get_most_recent_quarter(cls, quarter):
-        return cls.objects.filter(quarter=quarter).order_by("-year", "-quarter").first()
+        return cls.objects.filter(quarter=quarter).order_by("-year").first()
 
     @classmethod
     def get_most_recent_quarter_by_date(
-        cls, date: datetime | date, quarter: int
+        cls,
+        date: datetime | date,
+        quarter: int,
+        consumer_price_indices: dict | None = None,
     ) -> Union["ConsumerPriceIndex", None]:
+        """Pass consumer_price_indices (see get_all_by_year_and_quarter) when
+        looking up the figures for many dates to avoid a lookup per date"""
         if isinstance(date, datetime):
             date = date.date()
         year = date.year
         end_of_quarter_month = utils.month_from_cpi_quarter(quarter)
         if end_of_quarter_month > date.month:
             year -= 1
-        recent_quarter = cls.objects.filter(year=year, quarter=quarter).first()
+        if consumer_price_indices is not None:
+            recent_quarter = consumer_price_indices.get((year, quarter))
+        else:
+            recent_quarter = cls.get_by_year_and_quarter(year, quarter)
         if not recent_quarter:
             logger.info(
                 f"CPI data for {year}-Q{quarter} not yet available but will be available before supplied date: {date}"
@@ -111,6 +158,23 @@ class ConsumerPriceIndex(BaseModel):
         return recent_quarter
 
 
+@receiver(post_save, sender=ConsumerPriceIndex)
+@receiver(post_delete, sender=ConsumerPriceIndex)
+def clear_cpi_cache(sender, instance, **kwargs):
+    """Receivers rather than save/delete overrides so that queryset deletes
+    (e.g. the admin's bulk delete action) also clear the cache"""
+    periods = {(instance.year, instance.quarter)}
+    original_year_and_quarter = getattr(instance, "_original_year_and_quarter", None)
+    if original_year_and_quarter:
+        periods.add(original_year_and_quarter)
+    cache.delete_many(
+        [
+            settings.CACHE_KEY_CPI_BY_YEAR_AND_QUARTER.format(year, quarter)
+            for year, quarter in periods
+        ]
+    )
+
+
 class CPICalculationMethod(models.Model):
     name = models.CharField(max_length=255, null=False, blank=False, editable=False)
     display_name = models.CharField(max_length=255, null=False, blank=False)
@@ -142,6 +206,9 @@ class OracleCode(models.Model):
 
 class InvoicingDetailsManager(models.Manager):
     def get_queryset(self):
+        # Don't defer any fields of these prefetches: clone_invoicing_details
+        # saves the prefetched objects with pk=None to copy them, which
+        # fails for instances with deferred fields
         return (
             super()
             .get_queryset()
@@ -149,6 +216,7 @@ class InvoicingDetailsManager(models.Manager):
                 "annual_increment_amounts",
                 "annual_increment_percentages",
                 "gross_turnover_percentages",
+                "custom_cpi_years",
             )
         )
 
@@ -270,6 +338,11 @@ class InvoicingDetails(BaseModel):
     def invoices_yet_to_be_generated(self):
         return self.total_invoice_count - self.invoices_created
 
+    @cached_property
+    def consumer_price_indices(self):
+        """The CPI figures are read in one query for all the invoicing periods"""
+        return ConsumerPriceIndex.get_all_by_year_and_quarter()
+
     @property
     def invoicing_periods(self):
         """Returns an array of invoicing periods based on the invoicing details object"""
@@ -493,7 +566,7 @@ class InvoicingDetails(BaseModel):
         """
         invoices = []
         days_running_total = 0
-        amount_running_total = Decimal("0.00")
+        amount_running_total = DECIMAL_ZERO
         issue_date = self.get_first_issue_date()
         number = 0
         for i, invoicing_period in enumerate(self.invoicing_periods):
@@ -539,7 +612,7 @@ class InvoicingDetails(BaseModel):
                         amount_running_total + amount_object["amount"]
                     )
                 else:
-                    amount_running_total = amount_running_total + Decimal("0.00")
+                    amount_running_total = amount_running_total + DECIMAL_ZERO
 
                 number += 1  # Number only incremented for invoices that will be added to the preview
                 invoices.append(
@@ -562,7 +635,7 @@ class InvoicingDetails(BaseModel):
                         "days": invoicing_period["days"],
                         "days_running_total": days_running_total,
                         "amount_running_total": amount_running_total.quantize(
-                            Decimal("0.01")
+                            DECIMAL_ONE_CENT
                         ),
                         "start_date_has_passed": start_date_has_passed,
                         "end_date_has_passed": end_date_has_passed,
@@ -658,7 +731,7 @@ class InvoicingDetails(BaseModel):
         immediate_invoices = []
         for preview_invoice in self.preview_invoices:
             amount = preview_invoice["amount_object"]["amount"]
-            if amount != Decimal("0.00") and preview_invoice["start_date_has_passed"]:
+            if amount != DECIMAL_ZERO and preview_invoice["start_date_has_passed"]:
                 immediate_invoices.append(preview_invoice)
 
         if len(immediate_invoices) == 0:
@@ -691,7 +764,7 @@ class InvoicingDetails(BaseModel):
             amount = preview_invoice["amount_object"]["amount"]
             if (
                 amount is not None
-                and amount != Decimal("0.00")
+                and amount != DECIMAL_ZERO
                 and preview_invoice["start_date_has_passed"]
             ):
                 immediate_invoices.append(preview_invoice)
@@ -794,12 +867,12 @@ class InvoicingDetails(BaseModel):
         if self.invoicing_repetition_type.key == settings.REPETITION_TYPE_MONTHLY:
             amount = amount / 12
 
-        return amount.quantize(Decimal("0.01"))
+        return amount.quantize(DECIMAL_ONE_CENT)
 
     def get_amount_for_invoice(self, issue_date, start_date, end_date, days, index):
         amount_object = {
             "prefix": "$",
-            "amount": Decimal("0.00"),
+            "amount": DECIMAL_ZERO,
             "suffix": "",
         }
         if self.charge_method.key == settings.CHARGE_METHOD_ONCE_OFF_CHARGE:
@@ -825,13 +898,13 @@ class InvoicingDetails(BaseModel):
                 start_date, amount_object
             )
 
-        if not self.base_fee_amount or self.base_fee_amount == Decimal("0.00"):
+        if not self.base_fee_amount or self.base_fee_amount == DECIMAL_ZERO:
             amount_object["prefix"] = ""
             amount_object["amount"] = None
             amount_object["suffix"] = "Enter Base Fee"
             return amount_object
 
-        base_fee_amount = self.base_fee_amount.quantize(Decimal("0.01"))
+        base_fee_amount = self.base_fee_amount.quantize(DECIMAL_ONE_CENT)
 
         period_contains_leap_year_day = utils.period_contains_leap_year_day(
             datetime.strptime(start_date, "%Y-%m-%d").date(),
@@ -857,12 +930,14 @@ class InvoicingDetails(BaseModel):
             # for a totally unrelated period.
             cpi_date = start_date if start_date < issue_date else issue_date
             cpi = ConsumerPriceIndex.get_most_recent_quarter_by_date(
-                cpi_date, self.cpi_calculation_method.quarter
+                cpi_date,
+                self.cpi_calculation_method.quarter,
+                self.consumer_price_indices,
             )
             if cpi:
                 amount_object["amount"] = Decimal(
                     base_fee_amount * (1 + cpi.value / 100)
-                ).quantize(Decimal("0.01"))
+                ).quantize(DECIMAL_ONE_CENT)
                 amount_object["suffix"] = f" (CPI: {cpi.value}%)"
             else:
                 amount_object["amount"] = base_fee_amount
@@ -880,7 +955,7 @@ class InvoicingDetails(BaseModel):
                 if custom_cpi_year and custom_cpi_year.percentage:
                     amount_object["amount"] = Decimal(
                         base_fee_amount * (1 + custom_cpi_year.percentage / 100)
-                    ).quantize(Decimal("0.01"))
+                    ).quantize(DECIMAL_ONE_CENT)
                     amount_object["suffix"] = f" (CPI: {custom_cpi_year.percentage}%)"
                 else:
                     amount_object["suffix"] = " + CPI (CUSTOM)"
@@ -894,7 +969,7 @@ class InvoicingDetails(BaseModel):
             self.charge_method.key
             == settings.CHARGE_METHOD_BASE_FEE_PLUS_FIXED_ANNUAL_PERCENTAGE
         ):
-            percentage = Decimal("0.00")
+            percentage = DECIMAL_ZERO
             suffix = (
                 f"Enter percentage for year {year_sequence_index + 1}"
                 if year_sequence_index > 0
@@ -907,7 +982,7 @@ class InvoicingDetails(BaseModel):
                     )
                     percentage = annual_increment_percentage.increment_percentage
                     if not percentage:
-                        percentage = Decimal("0.00")
+                        percentage = DECIMAL_ZERO
                     base_fee_amount = base_fee_amount * (1 + percentage / 100)
                     suffix = ""
                 except IndexError:
@@ -923,14 +998,16 @@ class InvoicingDetails(BaseModel):
                         f"{index}. Using base fee amount."
                     )
 
-            amount_object["amount"] = Decimal(base_fee_amount).quantize(Decimal("0.01"))
+            amount_object["amount"] = Decimal(base_fee_amount).quantize(
+                DECIMAL_ONE_CENT
+            )
             amount_object["suffix"] = suffix
 
         if (
             self.charge_method.key
             == settings.CHARGE_METHOD_BASE_FEE_PLUS_FIXED_ANNUAL_INCREMENT
         ):
-            increment_amount = Decimal("0.00")
+            increment_amount = DECIMAL_ZERO
             suffix = (
                 f"Enter increment amount for year {year_sequence_index + 1}"
                 if year_sequence_index > 0
@@ -962,10 +1039,12 @@ class InvoicingDetails(BaseModel):
                         f"{index}. Using base fee amount."
                     )
 
-            amount_object["amount"] = Decimal(base_fee_amount).quantize(Decimal("0.01"))
+            amount_object["amount"] = Decimal(base_fee_amount).quantize(
+                DECIMAL_ONE_CENT
+            )
             amount_object["suffix"] = suffix
 
-        amount_object["amount"] = amount_object["amount"].quantize(Decimal("0.01"))
+        amount_object["amount"] = amount_object["amount"].quantize(DECIMAL_ONE_CENT)
 
         return amount_object
 
@@ -1041,22 +1120,22 @@ class InvoicingDetails(BaseModel):
 
         percentage = gross_turnover_percentage.percentage
         if not percentage:
-            percentage = Decimal("0.00")
+            percentage = DECIMAL_ZERO
 
         invoice_amount = Decimal(
             estimated_or_actual_gross_turnover * percentage / 100
-        ).quantize(Decimal("0.01"))
+        ).quantize(DECIMAL_ONE_CENT)
 
         amount_object["prefix"] = "$"
 
         if self.invoicing_repetition_type.key == settings.REPETITION_TYPE_QUARTERLY:
             amount_object["amount"] = Decimal(invoice_amount / 4).quantize(
-                Decimal("0.01")
+                DECIMAL_ONE_CENT
             )
 
         if self.invoicing_repetition_type.key == settings.REPETITION_TYPE_MONTHLY:
             amount_object["amount"] = Decimal(invoice_amount / 12).quantize(
-                Decimal("0.01")
+                DECIMAL_ONE_CENT
             )
 
         return amount_object
@@ -1112,84 +1191,108 @@ class InvoicingDetails(BaseModel):
             self.charge_method.key
             == settings.CHARGE_METHOD_PERCENTAGE_OF_GROSS_TURNOVER_IN_ARREARS
         ):
-            return self.process_gross_turnover_invoices_arrears()
+            generated_invoices = self.process_gross_turnover_invoices_arrears()
         elif (
             self.charge_method.key
             == settings.CHARGE_METHOD_PERCENTAGE_OF_GROSS_TURNOVER_IN_ADVANCE
         ):
-            return self.process_gross_turnover_invoices_advance()
+            generated_invoices = self.process_gross_turnover_invoices_advance()
         else:
             return
 
+        # Send email to notify finance group users once the invoices have been committed
+        transaction.on_commit(
+            lambda: send_new_invoices_raised_internal_notification(generated_invoices)
+        )
+
     def process_gross_turnover_invoices_arrears(self):
         """Select any annual, quarterly or monthly gross turnover amounts that are not locked
         create an invoice for them and then lock them so they are not processed again.
+
+        Returns a list of the invoices that were generated.
         """
-        gst_free = self.approval.approval_type.gst_free
+        approval = self.approval
+        gst_free = approval.approval_type.gst_free
+
+        generated_invoices = []
+        locked_quarter_ids = []
+        locked_month_ids = []
 
+        # Fetch the unlocked quarters and months for all years up front
+        # rather than querying them once per year
         gross_turnover_percentages = self.gross_turnover_percentages.filter(
             locked=False
+        ).prefetch_related(
+            Prefetch(
+                "quarters",
+                queryset=FinancialQuarter.objects.filter(
+                    gross_turnover__isnull=False, locked=False
+                ),
+                to_attr="unlocked_quarters",
+            ),
+            Prefetch(
+                "months",
+                queryset=FinancialMonth.objects.filter(
+                    gross_turnover__isnull=False, locked=False
+                ),
+                to_attr="unlocked_months",
+            ),
         )
         for gross_turnover_percentage in gross_turnover_percentages:
             if gross_turnover_percentage.gross_turnover is not None:
                 if (
                     gross_turnover_percentage.discrepency
-                    and gross_turnover_percentage.discrepency != Decimal("0.00")
+                    and gross_turnover_percentage.discrepency != DECIMAL_ZERO
                 ):
                     invoice = Invoice.objects.create(
-                        approval=self.approval,
+                        approval=approval,
                         amount=gross_turnover_percentage.discrepency_invoice_amount,
                         gst_free=gst_free,
                     )
-
-                    # Send email to notify finance group users
-                    send_new_invoice_raised_internal_notification(invoice)
+                    generated_invoices.append(invoice)
 
                 gross_turnover_percentage.locked = True
                 gross_turnover_percentage.save()
 
             if self.invoicing_repetition_type.key == settings.REPETITION_TYPE_QUARTERLY:
-                quarters = gross_turnover_percentage.quarters.filter(
-                    gross_turnover__isnull=False, locked=False
-                )
-                for quarter in quarters:
+                for quarter in gross_turnover_percentage.unlocked_quarters:
+                    locked_quarter_ids.append(quarter.id)
                     amount = quarter.gross_turnover * (
                         gross_turnover_percentage.percentage / 100
                     )
-                    if amount == Decimal("0.00"):
+                    if amount == DECIMAL_ZERO:
                         continue
 
                     invoice = Invoice.objects.create(
-                        approval=self.approval, amount=amount, gst_free=gst_free
+                        approval=approval, amount=amount, gst_free=gst_free
                     )
-
-                    # Send email to notify finance group users
-                    send_new_invoice_raised_internal_notification(invoice)
-
-                quarters.update(locked=True)
+                    generated_invoices.append(invoice)
 
             if self.invoicing_repetition_type.key == settings.REPETITION_TYPE_MONTHLY:
-                months = gross_turnover_percentage.months.filter(
-                    gross_turnover__isnull=False, locked=False
-                )
-                for month in months:
+                for month in gross_turnover_percentage.unlocked_months:
+                    locked_month_ids.append(month.id)
                     amount = month.gross_turnover * (
                         gross_turnover_percentage.percentage / 100
                     )
-                    if amount == Decimal("0.00"):
+                    if amount == DECIMAL_ZERO:
                         continue
 
                     invoice = Invoice.objects.create(
-                        approval=self.approval, amount=amount, gst_free=gst_free
+                        approval=approval, amount=amount, gst_free=gst_free
                     )
+                    generated_invoices.append(invoice)
 
-                    # Send email to notify finance group users
-                    send_new_invoice_raised_internal_notification(invoice)
+        FinancialQuarter.objects.filter(id__in=locked_quarter_ids).update(locked=True)
+        FinancialMonth.objects.filter(id__in=locked_month_ids).update(locked=True)
 
-                months.update(locked=True)
+        return generated_invoices
 
     def process_gross_turnover_invoices_advance(self):
-        gst_free = self.approval.approval_type.gst_free
+        """Returns a list of the invoices that were generated."""
+        approval = self.approval
+        gst_free = approval.approval_type.gst_free
+
+        generated_invoices = []
 
         gross_turnover_percentages = self.gross_turnover_percentages.filter(
             estimated_gross_turnover__isnull=False, estimate_locked=False
@@ -1209,15 +1312,13 @@ class InvoicingDetails(BaseModel):
             amount = gross_turnover_percentage.estimated_gross_turnover * (
                 gross_turnover_percentage.percentage / 100
             )
-            if amount == Decimal("0.00"):
+            if amount == DECIMAL_ZERO:
                 continue
 
             invoice = Invoice.objects.create(
-                approval=self.approval, amount=amount, gst_free=gst_free
+                approval=approval, amount=amount, gst_free=gst_free
             )
-
-            # Send email to notify finance group users
-            send_new_invoice_raised_internal_notification(invoice)
+            generated_invoices.append(invoice)
 
         gross_turnover_percentages.update(estimate_locked=True)
 
@@ -1228,19 +1329,19 @@ class InvoicingDetails(BaseModel):
             # Deal with cases where an estimate and actual have been entered
             if (
                 gross_turnover_percentage.discrepency
-                and gross_turnover_percentage.discrepency != Decimal("0.00")
+                and gross_turnover_percentage.discrepency != DECIMAL_ZERO
             ):
                 invoice = Invoice.objects.create(
-                    approval=self.approval,
+                    approval=approval,
                     amount=gross_turnover_percentage.discrepency_invoice_amount,
                     gst_free=gst_free,
                 )
-
-                # Send email to notify finance group users
-                send_new_invoice_raised_internal_notification(invoice)
+                generated_invoices.append(invoice)
 
         gross_turnover_percentages.update(locked=True)
 
+        return generated_invoices
+
     def turnover_entry_reminder_required(self, days_prior):
         if (
             not self.charge_method.key
@@ -1438,6 +1539,15 @@ class PercentageOfGrossTurnover(BaseModel):
     def financial_year_has_passed(self):
         return utils.financial_year_has_passed(self.financial_year)
 
+    @cached_property
+    def sum_of_quarters(self):
+        # The discrepency is read several times per instance (e.g. by discrepency_invoice_amount)
+        # so only sum the quarters once.
+        # For back dated financial years, there are no quarters entered so there will not be a discrepency
+        return self.quarters.aggregate(
+            sum=Coalesce(Sum("gross_turnover"), DECIMAL_ZERO)
+        )["sum"]
+
     @property
     def discrepency(self):
         if not self.gross_turnover:
@@ -1447,11 +1557,7 @@ class PercentageOfGrossTurnover(BaseModel):
             self.invoicing_details.charge_method.key
             == settings.CHARGE_METHOD_PERCENTAGE_OF_GROSS_TURNOVER_IN_ARREARS
         ):
-            sum_of_quarters = self.quarters.aggregate(sum=Sum("gross_turnover"))["sum"]
-            if not sum_of_quarters:
-                # For back dated financial years, there are no quarters entered so there will not be a discrepency
-                sum_of_quarters = Decimal("0.00")
-            discrepency = self.gross_turnover - sum_of_quarters
+            discrepency = self.gross_turnover - self.sum_of_quarters
 
         if (
             self.invoicing_details.charge_method.key
@@ -1462,7 +1568,7 @@ class PercentageOfGrossTurnover(BaseModel):
 
             discrepency = self.gross_turnover - self.estimated_gross_turnover
 
-        return discrepency.quantize(Decimal("0.01"))
+        return discrepency.quantize(DECIMAL_ONE_CENT)
 
     @property
     def discrepency_invoice_amount(self):
@@ -1474,7 +1580,7 @@ class PercentageOfGrossTurnover(BaseModel):
 
         discrepency_invoice_amount = self.discrepency * (self.percentage / 100)
 
-        return discrepency_invoice_amount.quantize(Decimal("0.01"))
+        return discrepency_invoice_amount.quantize(DECIMAL_ONE_CENT)
 
     @property
     def discrepency_invoice_type(self):
@@ -1560,7 +1666,7 @@ class FinancialMonth(BaseModel):
 class CustomCPIYear(BaseModel):
     year = models.PositiveSmallIntegerField()
     label = models.CharField(max_length=100, null=True, blank=True)
-    # Do not default percentage to Decimal("0.00") as it is possible for the inflation figure to be 0
+    # Do not default percentage to DECIMAL_ZERO as it is possible for the inflation figure to be 0
     percentage = models.DecimalField(
         max_digits=4, decimal_places=1, null=True, blank=True
     )
@@ -1584,13 +1690,35 @@ def invoice_pdf_upload_path(instance, filename):
     return f"approvals/{instance.approval.id}/invoices/{instance.id}/{filename}"
 
 
-class InvoiceManager(models.Manager):
+class InvoiceQuerySet(models.QuerySet):
+    def with_balance(self):
+        """Sums the transactions of each invoice in the same query so listing
+        invoices doesn't run an aggregate query per invoice for the balance"""
+        return self.annotate(
+            transactions_credit=Coalesce(
+                models.Sum("transactions__credit"), DECIMAL_ZERO
+            ),
+            transactions_debit=Coalesce(
+                models.Sum("transactions__debit"), DECIMAL_ZERO
+            ),
+        )
+
+
+class InvoiceManager(models.Manager.from_queryset(InvoiceQuerySet)):
     def get_queryset(self):
         return (
             super()
             .get_queryset()
             .select_related("approval")
-            .prefetch_related("transactions")
+            .prefetch_related(
+                # Only the transaction count and amounts are read from invoices
+                Prefetch(
+                    "transactions",
+                    queryset=InvoiceTransaction.objects.only(
+                        "id", "invoice", "credit", "debit"
+                    ),
+                )
+            )
         )
 
 
@@ -1693,18 +1821,27 @@ class Invoice(LicensingModel):
             self.oracle_code = self.invoicing_details.oracle_code
         super().save(*args, **kwargs)
 
-    @property
+    @cached_property
     def balance(self):
+        """Cached on the instance, cleared when one of its transactions is saved
+        or deleted (see clear_invoice_balance)"""
         amount = self.amount
         if not amount:
-            amount = Decimal("0.00")
+            amount = DECIMAL_ZERO
 
-        credit_debit_sums = self.transactions.aggregate(
-            credit=Coalesce(models.Sum("credit"), Decimal("0.00")),
-            debit=Coalesce(models.Sum("debit"), Decimal("0.00")),
-        )
-        balance = amount + credit_debit_sums["credit"] - credit_debit_sums["debit"]
-        return Decimal(balance).quantize(Decimal("0.01"))
+        if hasattr(self, "transactions_credit"):
+            # Annotated by InvoiceQuerySet.with_balance
+            credit = self.transactions_credit
+            debit = self.transactions_debit
+        else:
+            credit_debit_sums = self.transactions.aggregate(
+                credit=Coalesce(models.Sum("credit"), DECIMAL_ZERO),
+                debit=Coalesce(models.Sum("debit"), DECIMAL_ZERO),
+            )
+            credit = credit_debit_sums["credit"]
+            debit = credit_debit_sums["debit"]
+        balance = amount + credit - debit
+        return Decimal(balance).quantize(DECIMAL_ONE_CENT)
 
     @property
     def invoicing_details(self):
@@ -1724,7 +1861,7 @@ class Invoice(LicensingModel):
 
     @property
     def gst(self):
-        gst = Decimal("0.00")
+        gst = DECIMAL_ZERO
         if not self.gst_free:
             gst = helpers.gst_from_total(self.amount)
         return gst
@@ -1740,24 +1877,28 @@ class Invoice(LicensingModel):
         self.delete()
 
 
-class InvoiceTransactionManager(models.Manager):
-    def get_queryset(self):
-        return (
-            super()
-            .get_queryset()
-            .annotate(
-                cumulative_balance=Window(
-                    expression=Sum("debit"),
-                    order_by=F("datetime_created").asc(),
-                )
-                - Window(
-                    expression=Sum("credit"),
-                    order_by=F("datetime_created").asc(),
-                )
+class InvoiceTransactionQuerySet(models.QuerySet):
+    def with_running_balance(self):
+        """Only annotate the running balance where it is shown as the window
+        function sorts every transaction in the queryset"""
+        return self.annotate(
+            cumulative_balance=Window(
+                expression=Sum("debit"),
+                order_by=F("datetime_created").asc(),
+            )
+            - Window(
+                expression=Sum("credit"),
+                order_by=F("datetime_created").asc(),
             )
         )
 
 
+class InvoiceTransactionManager(
+    models.Manager.from_queryset(InvoiceTransactionQuerySet)
+):
+    pass
+
+
 class InvoiceTransaction(RevisionedMixin, models.Model):
     objects = InvoiceTransactionManager()
     invoice = models.ForeignKey(
@@ -1772,14 +1913,14 @@ class InvoiceTransaction(RevisionedMixin, models.Model):
         decimal_places=2,
         blank=False,
         null=False,
-        default=Decimal("0.00"),
+        default=DECIMAL_ZERO,
     )
     debit = models.DecimalField(
         max_digits=12,
         decimal_places=2,
         blank=False,
         null=False,
-        default=Decimal("0.00"),
+        default=DECIMAL_ZERO,
     )
     datetime_created = models.DateTimeField(auto_now_add=True)
     datetime_updated = models.DateTimeField(auto_now=True)
@@ -1787,6 +1928,19 @@ class InvoiceTransaction(RevisionedMixin, models.Model):
     class Meta:
         app_label = "leaseslicensing"
         ordering = ["datetime_created"]
+        indexes = [
+            models.Index(
+                fields=["invoice", "datetime_created"],
+                name="invoice_transaction_date_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Transaction: {self.id} for Invoice: {self.invoice} Credit: {self.credit}, Debit: {self.debit}"
+
+
+@receiver(post_save, sender=InvoiceTransaction)
+@receiver(post_delete, sender=InvoiceTransaction)
+def clear_invoice_balance(sender, instance, **kwargs):
+    if sender.invoice.is_cached(instance):
+        instance.invoice.__dict__.pop("balance", None)
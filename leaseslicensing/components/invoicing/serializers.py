@@ -519,6 +519,11 @@ class InvoicingDetailsSerializer(serializers.ModelSerializer):
             gross_turnover_percentages_data, instance
         )
         self.update_custom_cpi_years(custom_cpi_years_data, instance)
+
+        # The manager prefetches the reverse FKs updated above, drop the stale
+        # prefetches so that generating the invoices reads the saved values
+        if getattr(instance, "_prefetched_objects_cache", None):
+            instance._prefetched_objects_cache = {}
         return instance
 
     @staticmethod
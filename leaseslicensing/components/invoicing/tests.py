@@ -1,9 +1,118 @@
-from django.test import SimpleTestCase
+from datetime import date
+from decimal import Decimal
 
-from leaseslicensing.components.invoicing.models import ChargeMethod
+from django.conf import settings
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from ledger_api_client.ledger_models import EmailUserRO as EmailUser
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from leaseslicensing.components.approvals.models import Approval, ApprovalType
+from leaseslicensing.components.invoicing.api import InvoiceViewSet
+from leaseslicensing.components.invoicing.models import (
+    ChargeMethod,
+    Invoice,
+    InvoicingDetails,
+    RepetitionType,
+)
+from leaseslicensing.components.invoicing.serializers import InvoicingDetailsSerializer
 
 
 class ChargeMethodTestCase(SimpleTestCase):
     def test_charge_method(self):
         charge_method = ChargeMethod(key="test", display_name="Test")
         self.assertEqual(charge_method.key, "test")
+
+
+class InvoicingDetailsCustomCPITestCase(TestCase):
+    def setUp(self):
+        self.charge_method, _ = ChargeMethod.objects.get_or_create(
+            key=settings.CHARGE_METHOD_BASE_FEE_PLUS_ANNUAL_CPI_CUSTOM,
+            defaults={"display_name": "Base Fee Plus Annual CPI (Custom)"},
+        )
+        self.repetition_type, _ = RepetitionType.objects.get_or_create(
+            key=settings.REPETITION_TYPE_ANNUALLY,
+            defaults={"display_name": "Annually"},
+        )
+        self.invoicing_details = InvoicingDetails.objects.create(
+            charge_method=self.charge_method,
+            invoicing_repetition_type=self.repetition_type,
+            base_fee_amount=Decimal("365.00"),
+        )
+
+    def test_invoice_amount_includes_saved_custom_cpi(self):
+        # Loaded the same way as Proposal.save_invoicing_details
+        invoicing_details = InvoicingDetails.objects.get(id=self.invoicing_details.id)
+        amount_object = invoicing_details.get_amount_for_invoice(
+            None, "2025-01-01", "2025-12-31", 365, 0
+        )
+        self.assertEqual(amount_object["amount"], Decimal("365.00"))
+
+        InvoicingDetailsSerializer().update(
+            invoicing_details,
+            {
+                "base_fee_amount": invoicing_details.base_fee_amount,
+                "charge_method": self.charge_method,
+                "invoicing_repetition_type": self.repetition_type,
+                "annual_increment_amounts": [],
+                "annual_increment_percentages": [],
+                "gross_turnover_percentages": [],
+                "custom_cpi_years": [
+                    {"year": 1, "label": "Year 1", "percentage": Decimal("10.0")}
+                ],
+            },
+        )
+
+        amount_object = invoicing_details.get_amount_for_invoice(
+            None, "2025-01-01", "2025-12-31", 365, 0
+        )
+        self.assertEqual(amount_object["amount"], Decimal("401.50"))
+        self.assertEqual(amount_object["suffix"], " (CPI: 10.0%)")
+
+
+class InvoiceListQueryCountTestCase(TestCase):
+    def setUp(self):
+        approval_type = ApprovalType.objects.create(name="Test Lease")
+        self.approval = Approval.objects.create(
+            approval_type=approval_type,
+            issue_date=timezone.now(),
+            start_date=date(2025, 1, 1),
+            expiry_date=date(2029, 12, 31),
+        )
+        self.user = EmailUser(
+            id=1, email="finance@example.com", is_staff=True, is_superuser=True
+        )
+
+    def create_invoices(self, count):
+        # Invoice.save reads the invoicing details of the approval's current proposal
+        Invoice.objects.bulk_create(
+            [
+                Invoice(
+                    approval=self.approval,
+                    amount=Decimal("100.00"),
+                    status=Invoice.INVOICE_STATUS_UNPAID,
+                )
+                for _ in range(count)
+            ]
+        )
+
+    def list_invoices(self):
+        request = APIRequestFactory().get(
+            "/api/invoices/", {"format": "datatables", "draw": 1, "length": 10}
+        )
+        force_authenticate(request, user=self.user)
+        response = InvoiceViewSet.as_view({"get": "list"})(request)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_invoice_list_query_count_does_not_grow_with_invoices(self):
+        self.create_invoices(1)
+        with CaptureQueriesContext(connection) as single_invoice_queries:
+            self.list_invoices()
+
+        self.create_invoices(5)
+        with self.assertNumQueries(len(single_invoice_queries)):
+            response = self.list_invoices()
+        self.assertEqual(len(response.data["data"]), 6)
@@ -15,6 +15,7 @@ import math
 
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from ledger_api_client import utils as ledger_api_client_utils
 from rest_framework import serializers
@@ -409,16 +410,20 @@ def generate_ledger_invoice(invoice: Invoice) -> None:
     if isinstance(approval.applicant, Organisation):
         organisation = approval.applicant
         basket_params["organisation"] = organisation.ledger_organisation_id
-        admin_contact = organisation.contacts.filter(
-            user_role=OrganisationContact.USER_ROLE_CHOICE_ADMIN,
-            user_status=OrganisationContact.USER_STATUS_CHOICE_ACTIVE,
-        ).first()
-        if not admin_contact:
+        admin_contact_user_id = (
+            organisation.contacts.filter(
+                user_role=OrganisationContact.USER_ROLE_CHOICE_ADMIN,
+                user_status=OrganisationContact.USER_STATUS_CHOICE_ACTIVE,
+            )
+            .values_list("user", flat=True)
+            .first()
+        )
+        if not admin_contact_user_id:
             logger.error(
                 f"Unable to retrieve admin contact for organisation: {organisation}"
             )
             return
-        fake_request.user = retrieve_email_user(admin_contact.user)
+        fake_request.user = retrieve_email_user(admin_contact_user_id)
     else:
         fake_request.user = retrieve_email_user(approval.applicant.emailuser_id)
 
@@ -461,7 +466,13 @@ def generate_ledger_invoice(invoice: Invoice) -> None:
     invoice.order_number = data["order"]
     invoice.basket_id = data["basket_id"]
     invoice.invoice_reference = data["invoice"]
-    invoice.save()
+    # Only write the ledger fields rather than saving the whole invoice again
+    Invoice.objects.filter(pk=invoice.pk).update(
+        order_number=invoice.order_number,
+        basket_id=invoice.basket_id,
+        invoice_reference=invoice.invoice_reference,
+        datetime_updated=timezone.now(),
+    )
 
     # Attach the oracle invoice to ledger invoice
     response = ledger_api_client_utils.update_ledger_oracle_invoice(
@@ -479,8 +490,8 @@ def generate_ledger_invoice(invoice: Invoice) -> None:
             }
         )
 
-    # Send request for payment to proponent
-    send_new_invoice_raised_notification(invoice)
+    # Send request for payment to proponent (once any surrounding transaction has been committed)
+    transaction.on_commit(lambda: send_new_invoice_raised_notification(invoice))
 
 
 def clone_invoicing_details(
@@ -77,8 +77,10 @@ class LedgerDatatablesFilterBackend(DatatablesFilterBackend):
         self.SEARCH_THRESHOLD = kwargs.get("search_threshold", 2)
 
     @basic_exception_handler
-    def split_list_to_dict(self, list_to_split, ledger_keys=[]):
+    def split_list_to_dict(self, list_to_split, ledger_keys=None):
         result_dict = {}
+        if ledger_keys is None:
+            ledger_keys = []
 
         # The ledger key for this list of dot-notation fields
         applicable_ledger_keys = [
@@ -136,7 +138,7 @@ class LedgerDatatablesFilterBackend(DatatablesFilterBackend):
         return ordering
 
     @basic_exception_handler
-    def ledger_cache(self, queryset, filter_keys=[], **kwargs):
+    def ledger_cache(self, queryset, filter_keys=None, **kwargs):
         """
         Retrieves ledger accounts emailuser from cache. Creates a new cache if
         no cache exists
@@ -158,6 +160,8 @@ class LedgerDatatablesFilterBackend(DatatablesFilterBackend):
             A ledger emailuser accounts queryset from cache
         """
 
+        if filter_keys is None:
+            filter_keys = []
         model = kwargs.get("model", queryset.model)
         model_keys = kwargs.get("model_keys", self.LEDGER_LOOKUP_FIELDS)
         cache_prefix = kwargs.get("cache_prefix", self.CACHE_PREFIX)
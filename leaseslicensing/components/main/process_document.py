@@ -1,7 +1,4 @@
 import logging
-import os
-
-from django.core.files.base import ContentFile
 
 from leaseslicensing.components.approvals.models import (
     ApprovalType,
@@ -49,7 +46,7 @@ def process_generic_document(request, instance, document_type=None, *args, **kwa
                     id=d.id,
                     name=d.name,
                 )
-                for d in comms_instance.documents.all()
+                for d in comms_instance.documents.only("id", "name", "_file")
                 if d._file
             ]
             return {
@@ -140,8 +137,8 @@ def process_generic_document(request, instance, document_type=None, *args, **kwa
                         ),
                         id=d.id,
                         name=d.name,
-                        approval_type=d.approval_type.id,
-                        approval_type_document_type=d.approval_type_document_type.id,
+                        approval_type=d.approval_type_id,
+                        approval_type_document_type=d.approval_type_document_type_id,
                     )
                     for d in documents_qs.filter(input_name=input_name)
                     if d._file
@@ -159,7 +156,9 @@ def process_generic_document(request, instance, document_type=None, *args, **kwa
                     id=d.id,
                     name=d.name,
                 )
-                for d in documents_qs.filter(input_name=input_name)
+                for d in documents_qs.filter(input_name=input_name).only(
+                    "id", "name", "_file"
+                )
                 if d._file
             ]
             return {"filedata": returned_file_data}
@@ -176,9 +175,9 @@ def process_generic_document(request, instance, document_type=None, *args, **kwa
             ]
             return {"filedata": returned_file_data}
 
-    except Exception as e:
-        logger.exception(e)
-        raise e
+    except Exception:
+        logger.exception("Failed to process generic document")
+        raise
 
 
 def delete_document(request, instance, comms_instance, document_type, input_name=None):
@@ -271,11 +270,11 @@ def delete_document(request, instance, comms_instance, document_type, input_name
     elif "document_id" in request.data:
         document = instance.documents.get(id=document_id)
 
-    if document._file and os.path.isfile(document._file.path):
-        os.remove(document._file.path)
-
     if document:
-        document.delete()
+        file_name = document._file.name
+        # Some documents refuse deletion (can_delete=False) so keep their file
+        if document.delete() and file_name:
+            document._file.storage.delete(file_name)
 
 
 def cancel_document(request, instance, comms_instance, document_type, input_name=None):
@@ -319,10 +318,22 @@ def cancel_document(request, instance, comms_instance, document_type, input_name
     else:
         document_list = instance.documents.all()
 
-    for document in document_list:
-        if document._file and os.path.isfile(document._file.path):
-            os.remove(document._file.path)
-        document.delete()
+    if hasattr(document_list.model, "can_delete"):
+        # Documents that can no longer be deleted are kept along with their files
+        document_list = document_list.filter(can_delete=True)
+
+    # Delete the rows in one statement, then remove their files from storage
+    storage = document_list.model._meta.get_field("_file").storage
+    file_names = [
+        name
+        for name in document_list.values_list("_file", flat=True).iterator(
+            chunk_size=500
+        )
+        if name
+    ]
+    document_list.delete()
+    for file_name in file_names:
+        storage.delete(file_name)
 
     if comms_instance:
         return comms_instance.delete()
@@ -333,156 +344,97 @@ def save_document(request, instance, comms_instance, document_type, input_name=N
     if "filename" in request.data and input_name:
         filename = request.data.get("filename")
         _file = request.data.get("_file")
+        lookup = {"input_name": input_name, "name": filename}
 
         if document_type == "deed_poll_document":
-            document = instance.deed_poll_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.deed_poll_documents
             path_format_string = "proposals/{}/deed_poll_documents/{}"
         elif document_type == "supporting_document":
-            document = instance.supporting_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.supporting_documents
             path_format_string = "proposals/{}/proposed_approval_documents/{}"
         elif document_type == "proposed_approval_document":
-            document = instance.proposed_approval_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.proposed_approval_documents
             path_format_string = "proposals/{}/supporting_documents/{}"
         elif document_type == "exclusive_use_document":
-            document = instance.exclusive_use_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.exclusive_use_documents
             path_format_string = "proposals/{}/exclusive_use_documents/{}"
         elif document_type == "long_term_use_document":
-            document = instance.long_term_use_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.long_term_use_documents
             path_format_string = "proposals/{}/long_term_use_documents/{}"
         elif document_type == "consistent_purpose_document":
-            document = instance.consistent_purpose_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.consistent_purpose_documents
             path_format_string = "proposals/{}/consistent_purpose_documents/{}"
         elif document_type == "consistent_plan_document":
-            document = instance.consistent_plan_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.consistent_plan_documents
             path_format_string = "proposals/{}/consistent_plan_documents/{}"
         elif document_type == "clearing_vegetation_document":
-            document = instance.clearing_vegetation_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.clearing_vegetation_documents
             path_format_string = "proposals/{}/clearing_vegetation_documents/{}"
         elif document_type == "ground_disturbing_works_document":
-            document = instance.ground_disturbing_works_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.ground_disturbing_works_documents
             path_format_string = "proposals/{}/ground_disturbing_works_documents/{}"
         elif document_type == "heritage_site_document":
-            document = instance.heritage_site_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.heritage_site_documents
             path_format_string = "proposals/{}/heritage_site_documents/{}"
         elif document_type == "environmentally_sensitive_document":
-            document = instance.environmentally_sensitive_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.environmentally_sensitive_documents
             path_format_string = "proposals/{}/environmentally_sensitive_documents/{}"
         elif document_type == "wetlands_impact_document":
-            document = instance.wetlands_impact_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.wetlands_impact_documents
             path_format_string = "proposals/{}/wetlands_impact_documents/{}"
         elif document_type == "building_required_document":
-            document = instance.building_required_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.building_required_documents
             path_format_string = "proposals/{}/building_required_documents/{}"
         elif document_type == "significant_change_document":
-            document = instance.significant_change_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.significant_change_documents
             path_format_string = "proposals/{}/significant_change_documents/{}"
         elif document_type == "aboriginal_site_document":
-            document = instance.aboriginal_site_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.aboriginal_site_documents
             path_format_string = "proposals/{}/aboriginal_site_documents/{}"
         elif document_type == "native_title_consultation_document":
-            document = instance.native_title_consultation_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.native_title_consultation_documents
             path_format_string = "proposals/{}/native_title_consultation_documents/{}"
         elif document_type == "mining_tenement_document":
-            document = instance.mining_tenement_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.mining_tenement_documents
             path_format_string = "proposals/{}/mining_tenement_documents/{}"
         elif document_type == "profit_and_loss_document":
-            document = instance.profit_and_loss_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.profit_and_loss_documents
             path_format_string = "proposals/{}/profit_and_loss_documents/{}"
         elif document_type == "cash_flow_document":
-            document = instance.cash_flow_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.cash_flow_documents
             path_format_string = "proposals/{}/cash_flow_documents/{}"
         elif document_type == "capital_investment_document":
-            document = instance.capital_investment_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.capital_investment_documents
             path_format_string = "proposals/{}/capital_investment_documents/{}"
         elif document_type == "financial_capacity_document":
-            document = instance.financial_capacity_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.financial_capacity_documents
             path_format_string = "proposals/{}/financial_capacity_documents/{}"
         elif document_type == "available_activities_document":
-            document = instance.available_activities_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.available_activities_documents
             path_format_string = "proposals/{}/available_activities_documents/{}"
         elif document_type == "market_analysis_document":
-            document = instance.market_analysis_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.market_analysis_documents
             path_format_string = "proposals/{}/market_analysis_documents/{}"
         elif document_type == "staffing_document":
-            document = instance.staffing_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.staffing_documents
             path_format_string = "proposals/{}/staffing_documents/{}"
         elif document_type == "key_personnel_document":
-            document = instance.key_personnel_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.key_personnel_documents
             path_format_string = "proposals/{}/key_personnel_documents/{}"
         elif document_type == "key_milestones_document":
-            document = instance.key_milestones_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.key_milestones_documents
             path_format_string = "proposals/{}/key_milestones_documents/{}"
         elif document_type == "risk_factors_document":
-            document = instance.risk_factors_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.risk_factors_documents
             path_format_string = "proposals/{}/risk_factors_documents/{}"
         elif document_type == "legislative_requirements_document":
-            document = instance.legislative_requirements_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.legislative_requirements_documents
             path_format_string = "proposals/{}/legislative_requirements_documents/{}"
         elif document_type == "shapefile_document":
-            document = instance.shapefile_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.shapefile_documents
             path_format_string = "proposals/{}/shapefile_documents/{}"
         elif document_type == "proposed_decline_document":
-            document = instance.proposed_decline_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.proposed_decline_documents
             path_format_string = "proposals/{}/proposed_decline_documents/{}"
         elif document_type == "additional_document":
             proposal_additional_document_type = (
@@ -490,11 +442,10 @@ def save_document(request, instance, comms_instance, document_type, input_name=N
                     proposal=instance, additional_document_type__name=input_name
                 )
             )
-            document = instance.additional_documents.get_or_create(
-                input_name=input_name,
-                name=filename,
-                proposal_additional_document_type=proposal_additional_document_type,
-            )[0]
+            documents = instance.additional_documents
+            lookup["proposal_additional_document_type"] = (
+                proposal_additional_document_type
+            )
             path_format_string = "proposals/{}/additional_documents/{}"
         elif document_type == "lease_licence_approval_document":
             approval_type = request.data.get("approval_type")
@@ -510,42 +461,29 @@ def save_document(request, instance, comms_instance, document_type, input_name=N
                     name="Other"
                 ).id
 
-            document = instance.lease_licence_approval_documents.get_or_create(
-                input_name=input_name,
-                name=filename,
-                approval_type=ApprovalType.objects.get(id=approval_type),
-                approval_type_document_type=ApprovalTypeDocumentType.objects.get(
-                    id=approval_type_document_type
-                ),
-            )[0]
+            documents = instance.lease_licence_approval_documents
+            lookup["approval_type"] = ApprovalType.objects.get(id=approval_type)
+            lookup["approval_type_document_type"] = (
+                ApprovalTypeDocumentType.objects.get(id=approval_type_document_type)
+            )
             path_format_string = "proposals/{}/lease_licence_approval_documents/{}"
 
         # -------------- Approval
         elif document_type == "approval_cancellation_document":
-            document = instance.approval_cancellation_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.approval_cancellation_documents
             path_format_string = "approvals/{}/cancellation_documents/{}"
         elif document_type == "approval_surrender_document":
-            document = instance.approval_surrender_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.approval_surrender_documents
             path_format_string = "approvals/{}/surrender_documents/{}"
         elif document_type == "approval_suspension_document":
-            document = instance.approval_suspension_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.approval_suspension_documents
             path_format_string = "approvals/{}/suspension_documents/{}"
         elif document_type == "approval_transfer_supporting_document":
-            document = instance.approval_transfer_supporting_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.approval_transfer_supporting_documents
             path_format_string = "approval-transfer/{}/supporting-documents/{}"
         # -------------- Competitive Process
         elif document_type == "competitive_process_document":
-            document = instance.competitive_process_documents.get_or_create(
-                input_name=input_name, name=filename
-            )[0]
+            documents = instance.competitive_process_documents
             path_format_string = "competitive_process/{}/{}"
             # return '{}/competitive_process/{}/{}'.format(
             #     settings.MEDIA_APP_DIR,
@@ -555,53 +493,47 @@ def save_document(request, instance, comms_instance, document_type, input_name=N
 
         path = upload_protected_files_storage.save(
             path_format_string.format(instance.id, filename),
-            ContentFile(_file.read()),
+            _file,
         )
-        document._file = path
-        document.save()
+        documents.update_or_create(**lookup, defaults={"_file": path})
 
     # comms_log doc store save
     elif comms_instance and "filename" in request.data:
         filename = request.data.get("filename")
         _file = request.data.get("_file")
 
-        document = comms_instance.documents.get_or_create(name=filename)[0]
         path = upload_protected_files_storage.save(
             "{}/{}/communications/{}/documents/{}".format(
                 instance._meta.model_name, instance.id, comms_instance.id, filename
             ),
-            ContentFile(_file.read()),
+            _file,
+        )
+        comms_instance.documents.update_or_create(
+            name=filename, defaults={"_file": path}
         )
-
-        document._file = path
-        document.save()
 
     # default doc store save
     elif "filename" in request.data:
         filename = request.data.get("filename")
         _file = request.data.get("_file")
 
-        document = instance.documents.get_or_create(name=filename)[0]
         path = upload_protected_files_storage.save(
             "{}/{}/documents/{}".format(
                 instance._meta.model_name, instance.id, filename
             ),
-            ContentFile(_file.read()),
+            _file,
         )
-
-        document._file = path
-        document.save()
+        instance.documents.update_or_create(name=filename, defaults={"_file": path})
 
 
 # For transferring files from temp doc objs to default doc objs
 def save_default_document_obj(instance, temp_document):
-    document = instance.documents.get_or_create(name=temp_document.name)[0]
     path = upload_protected_files_storage.save(
         "{}/{}/documents/{}".format(
             instance._meta.model_name, instance.id, temp_document.name
         ),
         temp_document._file,
     )
-
-    document._file = path
-    document.save()
+    instance.documents.update_or_create(
+        name=temp_document.name, defaults={"_file": path}
+    )
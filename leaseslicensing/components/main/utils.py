@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import os
@@ -5,7 +6,6 @@ import re
 import sys
 from zipfile import ZipFile
 
-import geopandas as gpd
 import pytz
 import requests
 from django.apps import apps
@@ -124,6 +124,7 @@ def get_features_by_multipolygon(
     version="1.0.0",
     the_geom="wkb_geometry",
     srsName="urn:x-ogc:def:crs:EPSG:4326",
+    max_features=5000,
 ):
     """Queries a geoserver for features that intersect with a multipolygon
     and returns the response as a dict
@@ -136,6 +137,7 @@ def get_features_by_multipolygon(
         version (str): The WFS version to use
         the_geom (str): The name of the geometry column in the layer
         srsName (str): The name of the spatial reference system to return the data in
+        max_features (int): The maximum number of features to return
     """
 
     namespace = ""
@@ -152,7 +154,7 @@ def get_features_by_multipolygon(
         "version": version,
         "request": "GetFeature",
         "typeName": layer_title,
-        "maxFeatures": "5000",
+        "maxFeatures": str(max_features),
         "srsName": srsName,  # using the default projection for open layers and geodjango
         "outputFormat": "application/json",
         "propertyName": properties,
@@ -255,6 +257,19 @@ def get_gis_data_for_geometries(
     else:
         properties_comma_list = properties[0]
     logger.debug(f"layer_name: {layer_name}")
+
+    # The geometries rarely change between saves of an instance so the GIS data found for
+    # them is cached (including when nothing was found), keyed by a hash of the query
+    query_hash = hashlib.blake2b(
+        f"{server_url}|{layer_name}|{properties_comma_list}|{version}|{the_geom}".encode()
+        + bytes(multipolygon.wkb),
+        digest_size=16,
+    ).hexdigest()
+    cache_key = settings.CACHE_KEY_GIS_DATA_FOR_GEOMETRIES.format(query_hash)
+    data = cache.get(cache_key)
+    if data is not None:
+        return data or None
+
     features = get_features_by_multipolygon(
         multipolygon, server_url, layer_name, properties_comma_list, version, the_geom
     )
@@ -262,6 +277,7 @@ def get_gis_data_for_geometries(
         logger.warning(
             f"No GIS data found for {instance._meta.model.__name__} {instance.lodgement_number}"
         )
+        cache.set(cache_key, False, settings.CACHE_TIMEOUT_2_HOURS)
         return None
 
     logger.info(
@@ -283,6 +299,7 @@ def get_gis_data_for_geometries(
 
             data[prop.lower()].add(feature["properties"][prop])
 
+    cache.set(cache_key, data, settings.CACHE_TIMEOUT_2_HOURS)
     return data
 
 
@@ -300,6 +317,8 @@ def polygons_intersect_with_layer(
 ):
     """Checks if a polygon intersects with a layer"""
     multipolygon = MultiPolygon(polygons)
+    # The geoserver does the intersection and only whether any feature intersects
+    # matters here so there is no need to transfer more than one of them
     features = get_features_by_multipolygon(
         multipolygon,
         server_url,
@@ -307,6 +326,7 @@ def polygons_intersect_with_layer(
         properties=properties,
         version=version,
         the_geom=the_geom,
+        max_features=1,
     )
     if 0 == features["totalFeatures"]:
         return False
@@ -738,7 +758,7 @@ def populate_gis_data_lgas(instance, geometries_attribute, foreign_key_field):
     delete_gis_data(instance, foreign_key_field, ids_to_delete=object_ids)
 
 
-def delete_gis_data(instance, foreign_key_field, ids_to_delete=[]):
+def delete_gis_data(instance, foreign_key_field, ids_to_delete=None):
     """
     Deletes all GIS data objects for the given instance that are in the ids_to_delete list.
     The function tries to map GIS data property names to InstanceXyz model names. E.g.
@@ -752,6 +772,9 @@ def delete_gis_data(instance, foreign_key_field, ids_to_delete=[]):
             Example: {'leg_identifier': [1,2,3], 'leg_vesting': [4,5], 'category': []}
     """
 
+    if ids_to_delete is None:
+        ids_to_delete = {}
+
     for key in ids_to_delete:
         # Instance GIS data is stored in InstanceXyz models.
         # This matches for the Xyz part of the model name from GIS data property name
@@ -914,6 +937,9 @@ def validate_map_files(request, instance, foreign_key_field=None):
     # Validates shapefiles uploaded with via the proposal map or the competitive process map.
     # Shapefiles are valid when the shp, shx, and dbf extensions are provided
     # and when they intersect with DBCA legislated land or water polygons
+    # geopandas (and the pandas, numpy and GDAL bindings it loads) is only needed here
+    # so it is imported on first use rather than by every process that imports this module
+    import geopandas as gpd
 
     valid_geometry_saved = False
 
@@ -982,20 +1008,28 @@ def validate_map_files(request, instance, foreign_key_field=None):
         if geom_type not in ("Polygon", "MultiPolygon"):
             raise ValidationError(f"Geometry of type {geom_type} not allowed")
 
-        # Check for intersection with DBCA geometries
-        gdf_transform["valid"] = False
-        for geom in geometries:
-            srid = SpatialReference(
-                geometries.crs.srs
-            ).srid  # spatial reference identifier
+        # Add the file name as identifier to the geojson for use in the frontend
+        if "source_" not in gdf_transform:
+            gdf_transform["source_"] = shp_file_obj.name
+
+        srid = SpatialReference(geometries.crs.srs).srid  # spatial reference identifier
+        specs = tenure_layer_specification()
 
-            polygon = GEOSGeometry(geom.wkt, srid=srid)
+        # Some generic code to save the geometry to the database
+        # That will work for both a proposal instance and a competitive process instance
+        instance_name = instance._meta.model.__name__
 
-            # Add the file name as identifier to the geojson for use in the frontend
-            if "source_" not in gdf_transform:
-                gdf_transform["source_"] = shp_file_obj.name
+        if not foreign_key_field:
+            foreign_key_field = instance_name.lower()
 
-            specs = tenure_layer_specification()
+        geometry_model = apps.get_model("leaseslicensing", f"{instance_name}Geometry")
+
+        # Check for intersection with DBCA geometries
+        gdf_transform["valid"] = False
+        instance_geometries = []
+        for geom in geometries:
+            # WKB is an exact binary copy of the geometry and quicker to parse than WKT
+            polygon = GEOSGeometry(memoryview(geom.wkb), srid=srid)
 
             test_polygon = (
                 invert_xy_coordinates([polygon])[0] if specs["invert_xy"] else polygon
@@ -1016,26 +1050,18 @@ def validate_map_files(request, instance, foreign_key_field=None):
 
             gdf_transform["valid"] = True
 
-            # Some generic code to save the geometry to the database
-            # That will work for both a proposal instance and a competitive process instance
-            instance_name = instance._meta.model.__name__
-
-            if not foreign_key_field:
-                foreign_key_field = instance_name.lower()
-
-            geometry_model = apps.get_model(
-                "leaseslicensing", f"{instance_name}Geometry"
-            )
-
-            geometry_model.objects.create(
-                **{
-                    foreign_key_field: instance,
-                    "polygon": polygon,
-                    "intersects": True,
-                    "drawn_by": request.user.id,
-                }
+            instance_geometries.append(
+                geometry_model(
+                    **{
+                        foreign_key_field: instance,
+                        "polygon": polygon,
+                        "intersects": True,
+                        "drawn_by": request.user.id,
+                    }
+                )
             )
 
+        geometry_model.objects.bulk_create(instance_geometries, batch_size=500)
         instance.save()
         valid_geometry_saved = True
 
@@ -64,6 +64,7 @@ from leaseslicensing.components.organisations.serializers import (
     OrgUserAcceptSerializer,
 )
 from leaseslicensing.components.organisations.utils import (
+    annotate_organisation_permissions,
     can_admin_org,
     get_organisation_ids_for_user,
 )
@@ -512,7 +513,7 @@ class OrganisationViewSet(UserActionLoggingViewset, KeyValueListMixin):
     @basic_exception_handler
     def comms_log(self, request, *args, **kwargs):
         instance = self.get_object()
-        qs = instance.comms_logs.all()
+        qs = instance.comms_logs.prefetch_related("documents")
         serializer = OrganisationCommsSerializer(qs, many=True)
         return Response(serializer.data)
 
@@ -981,7 +982,7 @@ class OrganisationRequestsViewSet(UserActionLoggingViewset, NoPaginationListMixi
     @basic_exception_handler
     def comms_log(self, request, *args, **kwargs):
         instance = self.get_object()
-        qs = instance.comms_logs.all()
+        qs = instance.comms_logs.prefetch_related("documents")
         serializer = OrganisationRequestCommsSerializer(qs, many=True)
         return Response(serializer.data)
 
@@ -1160,13 +1161,15 @@ class MyOrganisationsViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         user = self.request.user
         if is_internal(self.request):
-            return Organisation.objects.all()
+            queryset = Organisation.objects.all()
         elif is_customer(self.request):
-            return Organisation.objects.filter(
+            queryset = Organisation.objects.filter(
                 contacts__user=user.id,
                 contacts__user_status=OrganisationContact.USER_STATUS_CHOICE_ACTIVE,
             )
-        return Organisation.objects.none()
+        else:
+            return Organisation.objects.none()
+        return annotate_organisation_permissions(queryset, user)
 
     @logging_action(
         methods=[
@@ -728,6 +728,23 @@ class Organisation(models.Model):
         )
 
 
+class OrganisationContactQuerySet(models.QuerySet):
+    def can_edit(self):
+        """The contacts whose can_edit property is True, filtered in the database"""
+        return self.filter(
+            user_status=OrganisationContact.USER_STATUS_CHOICE_ACTIVE,
+            user_role=OrganisationContact.USER_ROLE_CHOICE_ADMIN,
+        )
+
+    def check_consultant(self):
+        """The contacts whose check_consultant property is True, filtered in the
+        database"""
+        return self.filter(
+            user_status=OrganisationContact.USER_STATUS_CHOICE_ACTIVE,
+            user_role=OrganisationContact.USER_ROLE_CHOICE_CONSULTANT,
+        )
+
+
 class OrganisationContact(models.Model):
     USER_STATUS_CHOICE_DRAFT = "draft"
     USER_STATUS_CHOICE_PENDING = "pending"
@@ -789,10 +806,22 @@ class OrganisationContact(models.Model):
         max_length=50, null=True, blank=True, verbose_name="fax number", help_text=""
     )
 
+    objects = OrganisationContactQuerySet.as_manager()
+
     class Meta:
         app_label = "leaseslicensing"
         unique_together = (("organisation", "email"),)
         ordering = ("organisation", "last_name", "first_name")
+        indexes = [
+            models.Index(
+                fields=["organisation", "user_role", "user_status"],
+                name="org_contact_role_status_idx",
+            ),
+            models.Index(fields=["organisation", "user"], name="org_contact_user_idx"),
+            models.Index(
+                fields=["user", "user_status"], name="org_contact_user_status_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.last_name} {self.first_name} ({self.organisation})"
@@ -917,7 +946,7 @@ class OrganisationAction(UserAction):
 
 def update_organisation_comms_log_filename(instance, filename):
     return "organisations/{}/communications/{}/{}".format(
-        instance.log_entry.organisation.id, instance.id, filename
+        instance.log_entry.organisation_id, instance.id, filename
     )
 
 
@@ -1213,7 +1242,7 @@ class OrganisationRequestDeclinedDetails(models.Model):
 
 def update_organisation_request_comms_log_filename(instance, filename):
     return "organisation_requests/{}/communications/{}/{}".format(
-        instance.log_entry.request.id, instance.id, filename
+        instance.log_entry.request_id, instance.id, filename
     )
 
 
@@ -1,4 +1,6 @@
-from django.db.models.signals import post_save, pre_save
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from ledger_api_client.ledger_models import EmailUserRO as EmailUser
 
@@ -31,6 +33,22 @@ class OrganisationListener:
             instance.user_pin_two = instance._generate_pin()
 
 
+class OrganisationContactListener:
+    """
+    Event listener for OrganisationContact
+    """
+
+    @staticmethod
+    @receiver(post_save, sender=OrganisationContact)
+    @receiver(post_delete, sender=OrganisationContact)
+    def _clear_admin_emails(sender, instance, **kwargs):
+        cache.delete(
+            settings.CACHE_KEY_ORGANISATION_ADMIN_EMAILS.format(
+                instance.organisation_id
+            )
+        )
+
+
 class EmailUserUpdateContactListener:
     @staticmethod
     @receiver(post_save, sender=EmailUser)
@@ -42,9 +60,21 @@ class EmailUserUpdateContactListener:
         )
         if original_instance:
             try:
-                OrganisationContact.objects.filter(
+                contacts = OrganisationContact.objects.filter(
                     email=original_instance.email
-                ).update(
+                )
+                # update() does not send signals so clear the cached admin emails here
+                cache.delete_many(
+                    [
+                        settings.CACHE_KEY_ORGANISATION_ADMIN_EMAILS.format(
+                            organisation_id
+                        )
+                        for organisation_id in contacts.values_list(
+                            "organisation_id", flat=True
+                        )
+                    ]
+                )
+                contacts.update(
                     first_name=instance.first_name,
                     last_name=instance.last_name,
                     mobile_number=instance.mobile_number,
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from django.test import TestCase
+
+from leaseslicensing.components.organisations.models import (
+    Organisation,
+    OrganisationContact,
+)
+from leaseslicensing.components.organisations.utils import (
+    has_atleast_one_admin,
+    is_last_admin,
+)
+
+
+class OrganisationAdminTestCase(TestCase):
+    def setUp(self):
+        # bulk_create skips Organisation.save and OrganisationContact.save,
+        # which look up the organisation and user in ledger
+        (self.organisation,) = Organisation.objects.bulk_create(
+            [Organisation(ledger_organisation_id=1)]
+        )
+        self.admin = SimpleNamespace(id=1, email="admin@example.com")
+        self.other_admin = SimpleNamespace(id=2, email="other.admin@example.com")
+
+    def create_contact(self, user, user_role, user_status=None):
+        OrganisationContact.objects.bulk_create(
+            [
+                OrganisationContact(
+                    organisation=self.organisation,
+                    user=user.id,
+                    email=user.email,
+                    first_name="Test",
+                    last_name="Contact",
+                    user_role=user_role,
+                    user_status=user_status
+                    or OrganisationContact.USER_STATUS_CHOICE_ACTIVE,
+                )
+            ]
+        )
+
+    def test_organisation_without_admins(self):
+        self.create_contact(self.admin, OrganisationContact.USER_ROLE_CHOICE_USER)
+        self.create_contact(
+            self.other_admin,
+            OrganisationContact.USER_ROLE_CHOICE_ADMIN,
+            OrganisationContact.USER_STATUS_CHOICE_SUSPENDED,
+        )
+        self.assertFalse(has_atleast_one_admin(self.organisation))
+        self.assertFalse(is_last_admin(self.organisation, self.admin))
+
+    def test_single_admin_is_last_admin(self):
+        self.create_contact(self.admin, OrganisationContact.USER_ROLE_CHOICE_ADMIN)
+        self.assertTrue(has_atleast_one_admin(self.organisation))
+        self.assertTrue(is_last_admin(self.organisation, self.admin))
+        self.assertFalse(is_last_admin(self.organisation, self.other_admin))
+
+    def test_one_of_several_admins_is_not_last_admin(self):
+        self.create_contact(self.admin, OrganisationContact.USER_ROLE_CHOICE_ADMIN)
+        self.create_contact(
+            self.other_admin, OrganisationContact.USER_ROLE_CHOICE_ADMIN
+        )
+        self.assertTrue(has_atleast_one_admin(self.organisation))
+        self.assertFalse(is_last_admin(self.organisation, self.admin))
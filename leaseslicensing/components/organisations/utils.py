@@ -1,51 +1,97 @@
-import random
+import os
 import string
+from functools import wraps
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import EmptyResultSet
+from django.db.models import Exists, OuterRef
 from ledger_api_client.ledger_models import EmailUserRO as EmailUser
 
 from leaseslicensing.helpers import belongs_to_by_user_id
 
 
+def memoize_on_user(func):
+    """Organisation permission checks are often made several times per request for
+    the same organisation and user (e.g. by serializers), so the results are
+    memoized on the user object, which lives as long as the request"""
+
+    @wraps(func)
+    def wrapper(organisation, user):
+        if user.is_anonymous:
+            return func(organisation, user)
+
+        organisation_permissions = getattr(user, "_organisation_permissions", None)
+        if organisation_permissions is None:
+            organisation_permissions = {}
+            user._organisation_permissions = organisation_permissions
+
+        key = (func.__name__, getattr(organisation, "id", organisation))
+        if key not in organisation_permissions:
+            organisation_permissions[key] = func(organisation, user)
+
+        return organisation_permissions[key]
+
+    return wrapper
+
+
+@memoize_on_user
 def can_manage_org(organisation, user):
-    from leaseslicensing.components.organisations.models import UserDelegation
+    from leaseslicensing.components.organisations.models import (
+        OrganisationContact,
+        UserDelegation,
+    )
 
     if user.is_anonymous:
         return False
     if user.is_superuser:
         return True
 
-    try:
-        # Not 100% sure what was intended here see git history for what was here before
-        UserDelegation.objects.get(organisation=organisation, user=user.id)
-        return can_admin_org(organisation, user.id)
-    except UserDelegation.DoesNotExist:
+    # Not 100% sure what was intended here see git history for what was here before
+    # Fetch the delegation along with whether the user's contact can edit (i.e. is an
+    # active admin, which is what can_admin_org checks for delegates) in one query
+    delegation = (
+        UserDelegation.objects.filter(organisation=organisation, user=user.id)
+        .annotate(
+            can_edit=Exists(
+                OrganisationContact.objects.can_edit().filter(
+                    organisation=OuterRef("organisation"), user=user.id
+                )
+            )
+        )
+        .values("can_edit")
+        .first()
+    )
+    if delegation is None:
         return belongs_to_by_user_id(user.id, settings.GROUP_NAME_ORGANISATION_ACCESS)
 
+    if belongs_to_by_user_id(user.id, settings.ADMIN_GROUP):
+        return True
+
+    return bool(delegation["can_edit"])
+
 
 def is_last_admin(organisation, user):
     from leaseslicensing.components.organisations.models import OrganisationContact
 
     """ A check for whether the user contact is the only administrator for the Organisation. """
-    _last_admin = False
-    try:
-        _admin_contacts = OrganisationContact.objects.filter(
-            organisation_id=organisation,
-            user_status="active",
-            user_role="organisation_admin",
-        )
-        _is_admin = _admin_contacts.filter(email=user.email).exists()
-        if _is_admin and _admin_contacts.count() < 2:
-            _last_admin = True
-    except OrganisationContact.DoesNotExist:
-        _last_admin = False
-    return _last_admin
+    # Reading at most two admins is enough to tell whether the user is the only one
+    _admin_emails = list(
+        OrganisationContact.objects.can_edit()
+        .filter(organisation_id=organisation)
+        .values_list("email", flat=True)[:2]
+    )
+    return len(_admin_emails) == 1 and _admin_emails[0] == user.email
 
 
 def can_admin_org(organisation, user_id):
     from leaseslicensing.components.organisations.models import OrganisationContact
 
+    # Use the value from annotate_organisation_permissions if the organisation has it
+    user_is_admin = getattr(organisation, "_user_is_admin", None)
+    if user_is_admin:
+        return True
+
     try:
         emailuser = EmailUser.objects.get(id=user_id)
     except EmailUser.DoesNotExist:
@@ -57,106 +103,181 @@ def can_admin_org(organisation, user_id):
     if belongs_to_by_user_id(user_id, settings.ADMIN_GROUP):
         return True
 
-    try:
-        org_contact = OrganisationContact.objects.get(
-            organisation_id=organisation, user=user_id
-        )
-        return org_contact.can_edit
-    except OrganisationContact.DoesNotExist:
-        return False
+    if user_is_admin is not None:
+        return user_is_admin
+
+    return (
+        OrganisationContact.objects.can_edit()
+        .filter(organisation_id=organisation, user=user_id)
+        .exists()
+    )
+
+
+@memoize_on_user
+def get_contact_state(organisation, user):
+    """Returns the status and role of the user's contact for the Organisation (or None
+    if there is no such contact) so the contact checks below share a single query"""
+    from leaseslicensing.components.organisations.models import OrganisationContact
+
+    return (
+        OrganisationContact.objects.filter(organisation=organisation, email=user.email)
+        .values("user_status", "user_role")
+        .first()
+    )
 
 
 def can_relink(organisation, user):
+    """Check user contact can be relinked to the Organisation."""
     from leaseslicensing.components.organisations.models import OrganisationContact
 
-    """ Check user contact can be relinked to the Organisation. """
-    _can_relink = False
-    try:
-        _can_relink = OrganisationContact.objects.filter(
-            organisation_id=organisation.id, email=user.email, user_status="unlinked"
-        ).exists()
-    except OrganisationContact.DoesNotExist:
-        _can_relink = False
-    return _can_relink
+    contact_state = get_contact_state(organisation, user)
+    return (
+        contact_state is not None
+        and contact_state["user_status"]
+        == OrganisationContact.USER_STATUS_CHOICE_UNLINKED
+    )
 
 
 def can_approve(organisation, user):
+    """Check user contact linkage to the Organisation can be approved."""
     from leaseslicensing.components.organisations.models import OrganisationContact
 
-    """ Check user contact linkage to the Organisation can be approved. """
-    _can_approve = False
-    try:
-        _can_approve = OrganisationContact.objects.filter(
-            organisation_id=organisation.id,
-            email=user.email,
-            user_status__in=("declined", "pending"),
-        ).exists()
-    except OrganisationContact.DoesNotExist:
-        _can_approve = False
-    return _can_approve
+    contact_state = get_contact_state(organisation, user)
+    return contact_state is not None and contact_state["user_status"] in (
+        OrganisationContact.USER_STATUS_CHOICE_DECLINED,
+        OrganisationContact.USER_STATUS_CHOICE_PENDING,
+    )
 
 
 def is_consultant(organisation, user):
     from leaseslicensing.components.organisations.models import OrganisationContact
 
-    try:
-        org_contact = OrganisationContact.objects.get(
-            organisation_id=organisation, email=user.email
-        )
-        return org_contact.check_consultant
-    except OrganisationContact.DoesNotExist:
-        return False
+    user_is_consultant = getattr(organisation, "_user_is_consultant", None)
+    if user_is_consultant is not None:
+        return user_is_consultant
+
+    contact_state = get_contact_state(organisation, user)
+    return (
+        contact_state is not None
+        and contact_state["user_status"]
+        == OrganisationContact.USER_STATUS_CHOICE_ACTIVE
+        and contact_state["user_role"]
+        == OrganisationContact.USER_ROLE_CHOICE_CONSULTANT
+    )
+
+
+def annotate_organisation_permissions(queryset, user):
+    """Annotates whether the user is an admin or consultant of each organisation so
+    that can_admin_org and is_consultant don't need to query per row when a list of
+    organisations is serialized for that user"""
+    from leaseslicensing.components.organisations.models import OrganisationContact
+
+    contacts = OrganisationContact.objects.filter(organisation=OuterRef("pk"))
+    return queryset.annotate(
+        _user_is_admin=Exists(contacts.can_edit().filter(user=user.id)),
+        _user_is_consultant=Exists(
+            contacts.check_consultant().filter(email=user.email)
+        ),
+    )
 
 
 def random_generator(size=12, chars=string.digits):
-    return "".join(random.choice(chars) for _ in range(size))
+    # Used to generate the organisation link pins so draw from the OS's secure source,
+    # discarding bytes that would bias the modulo towards the first characters
+    limit = 256 - 256 % len(chars)
+    generated = []
+    while len(generated) < size:
+        generated.extend(
+            chars[byte % len(chars)] for byte in os.urandom(size * 2) if byte < limit
+        )
+    return "".join(generated[:size])
 
 
 def has_atleast_one_admin(organisation):
     from leaseslicensing.components.organisations.models import OrganisationContact
 
     """ A check for whether Organisation has atlease one admin user """
-    _atleast_one_admin = False
-    try:
-        _admin_contacts = OrganisationContact.objects.filter(
-            organisation_id=organisation,
-            user_status="active",
-            user_role="organisation_admin",
-            is_admin=True,
-        )
-        if _admin_contacts.count() > 0:
-            _atleast_one_admin = True
-    except OrganisationContact.DoesNotExist:
-        _atleast_one_admin = False
-    return _atleast_one_admin
+    return (
+        OrganisationContact.objects.can_edit()
+        .filter(organisation_id=organisation)
+        .exists()
+    )
 
 
 def get_organisation_ids_for_user(email_user_id):
     from leaseslicensing.components.organisations.models import (
         Organisation,
         OrganisationContact,
+        UserDelegation,
     )
 
+    # Semi-joins rather than joins so no row multiplication or DISTINCT is needed
     return list(
         Organisation.objects.filter(
-            delegates__user=email_user_id,
-            contacts__user=email_user_id,
-            contacts__user_status=OrganisationContact.USER_STATUS_CHOICE_ACTIVE,
+            Exists(
+                UserDelegation.objects.filter(
+                    organisation=OuterRef("pk"), user=email_user_id
+                )
+            ),
+            Exists(
+                OrganisationContact.objects.filter(
+                    organisation=OuterRef("pk"),
+                    user=email_user_id,
+                    user_status=OrganisationContact.USER_STATUS_CHOICE_ACTIVE,
+                )
+            ),
         ).values_list("id", flat=True)
     )
 
 
-def get_admin_emails_for_organisation(organisation_id):
+def get_admin_emails_for_organisations(organisation_ids):
+    """Returns a dict of the active admin emails of each of the organisations.
+    Admin emails are read every time an organisation is notified but rarely change
+    so they are cached, and those not cached are read in a single query. The cache
+    entries are cleared whenever a contact of the organisation is saved or deleted
+    (see organisations.signals)"""
     from leaseslicensing.components.organisations.models import OrganisationContact
 
-    active_admin_contacts = OrganisationContact.objects.filter(
-        organisation_id=organisation_id,
-        user_status="active",
-        user_role="organisation_admin",
-    ).values_list("email", flat=True)
-    if active_admin_contacts.count() == 0:
+    cache_key = settings.CACHE_KEY_ORGANISATION_ADMIN_EMAILS
+    cache_keys = {
+        cache_key.format(organisation_id): organisation_id
+        for organisation_id in organisation_ids
+    }
+    admin_emails = {
+        cache_keys[key]: emails
+        for key, emails in cache.get_many(cache_keys.keys()).items()
+    }
+
+    uncached_admin_emails = {
+        organisation_id: []
+        for organisation_id in organisation_ids
+        if organisation_id not in admin_emails
+    }
+    if uncached_admin_emails:
+        for organisation_id, email in (
+            OrganisationContact.objects.can_edit()
+            .filter(organisation_id__in=uncached_admin_emails.keys())
+            .values_list("organisation_id", "email")
+        ):
+            uncached_admin_emails[organisation_id].append(email)
+        cache.set_many(
+            {
+                cache_key.format(organisation_id): emails
+                for organisation_id, emails in uncached_admin_emails.items()
+            },
+            settings.CACHE_TIMEOUT_2_HOURS,
+        )
+        admin_emails.update(uncached_admin_emails)
+
+    return admin_emails
+
+
+def get_admin_emails_for_organisation(organisation_id):
+    admin_emails = get_admin_emails_for_organisations([organisation_id])
+    active_admin_emails = admin_emails[organisation_id]
+    if not active_admin_emails:
         raise EmptyResultSet(
             f"No active admin contacts found for Organisation: {organisation_id}"
         )
 
-    return list(active_admin_contacts)
+    return active_admin_emails
@@ -290,6 +290,13 @@ class ProposalPaginatedViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Proposal.objects.none()
     serializer_class = ListProposalSerializer
     page_size = 10
+    # The free text answers of a proposal are only shown on its details page so they are
+    # not loaded for the proposal lists
+    list_deferred_fields = [
+        field.name
+        for field in Proposal._meta.concrete_fields
+        if field.name.endswith("_text")
+    ]
 
     def get_queryset(self):
         user = self.request.user
@@ -372,7 +379,7 @@ class ProposalPaginatedViewSet(viewsets.ReadOnlyModelViewSet):
                 referrals__referral=email_user_id_assigned,
             ).annotate(referral_processing_status=F("referrals__processing_status"))
 
-        qs = self.filter_queryset(qs)
+        qs = self.filter_queryset(qs).defer(*self.list_deferred_fields).with_related()
 
         self.paginator.page_size = qs.count()
         result_page = self.paginator.paginate_queryset(qs, request)
@@ -397,7 +404,7 @@ class ProposalPaginatedViewSet(viewsets.ReadOnlyModelViewSet):
         """
         qs = self.get_queryset().exclude(processing_status="discarded")
         # qs = self.filter_queryset(self.request, qs, self)
-        qs = self.filter_queryset(qs)
+        qs = self.filter_queryset(qs).defer(*self.list_deferred_fields).with_related()
 
         # on the internal organisations dashboard, filter the Proposal/Approval/Compliance
         # datatables by applicant/organisation
@@ -424,7 +431,10 @@ class ProposalViewSet(UserActionLoggingViewset):
     def get_queryset(self):
         user = self.request.user
         if is_internal(self.request):
-            return Proposal.objects.all()
+            qs = Proposal.objects.all()
+            if self.action == "retrieve":
+                qs = qs.with_detail()
+            return qs
         elif is_customer(self.request):
             qs = Proposal.get_proposals_for_emailuser(user.id)
             if Referral.objects.filter(referral=user.id).exists():
@@ -1001,7 +1011,7 @@ class ProposalViewSet(UserActionLoggingViewset):
     @basic_exception_handler
     def comms_log(self, request, *args, **kwargs):
         instance = self.get_object()
-        qs = instance.comms_logs.all()
+        qs = instance.comms_logs.prefetch_related("documents")
         serializer = ProposalLogEntrySerializer(qs, many=True)
         return Response(serializer.data)
 
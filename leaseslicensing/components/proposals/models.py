@@ -1,9 +1,9 @@
 import calendar
-import copy
 import datetime
 import json
 import logging
-import subprocess
+import os
+import shutil
 from copy import deepcopy
 from decimal import Decimal
 
@@ -18,10 +18,11 @@ from django.contrib.postgres.fields import ArrayField
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError, models, transaction
-from django.db.models import F, JSONField, Max, Min, Q
+from django.db.models import F, JSONField, Max, Min, Q, Subquery
 from django.db.models.functions import Cast
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
 from ledger_api_client.ledger_models import EmailUserRO as EmailUser
 from ledger_api_client.managed_models import SystemGroup
@@ -88,7 +89,7 @@ from leaseslicensing.components.tenure.models import (
     Vesting,
 )
 from leaseslicensing.helpers import is_approver, is_customer, user_ids_in_group
-from leaseslicensing.ledger_api_utils import retrieve_email_user
+from leaseslicensing.ledger_api_utils import retrieve_email_user, retrieve_email_users
 from leaseslicensing.settings import (
     APPLICATION_TYPE_LEASE_LICENCE,
     APPLICATION_TYPE_REGISTRATION_OF_INTEREST,
@@ -105,46 +106,46 @@ logger = logging.getLogger(__name__)
 
 
 def update_proposal_doc_filename(instance, filename):
-    return f"proposals/{instance.proposal.id}/documents/{filename}"
+    return f"proposals/{instance.proposal_id}/documents/{filename}"
 
 
 def update_qaofficer_doc_filename(instance, filename):
-    return f"proposals/{instance.proposal.id}/qaofficer/{filename}"
+    return f"proposals/{instance.proposal_id}/qaofficer/{filename}"
 
 
 def update_referral_doc_filename(instance, filename):
-    return f"proposals/{instance.referral.proposal.id}/referral/{filename}"
+    return f"proposals/{instance.referral.proposal_id}/referral/{filename}"
 
 
 def update_proposal_required_doc_filename(instance, filename):
-    return f"proposals/{instance.proposal.id}/required_documents/{filename}"
+    return f"proposals/{instance.proposal_id}/required_documents/{filename}"
 
 
 def update_requirement_doc_filename(instance, filename):
     return "proposals/{}/requirement_documents/{}".format(
-        instance.requirement.proposal.id, filename
+        instance.requirement.proposal_id, filename
     )
 
 
 def update_proposal_comms_log_filename(instance, filename):
-    return f"proposals/{instance.log_entry.proposal.id}/{filename}"
+    return f"proposals/{instance.log_entry.proposal_id}/{filename}"
 
 
 def update_events_park_doc_filename(instance, filename):
     return "proposals/{}/events_park_documents/{}".format(
-        instance.events_park.proposal.id, filename
+        instance.events_park.proposal_id, filename
     )
 
 
 def update_pre_event_park_doc_filename(instance, filename):
     return "proposals/{}/pre_event_park_documents/{}".format(
-        instance.pre_event_park.proposal.id, filename
+        instance.pre_event_park.proposal_id, filename
     )
 
 
 def update_additional_doc_filename(instance, filename):
     return "proposals/{}/additional_documents/{}/{}".format(
-        instance.proposal.id,
+        instance.proposal_id,
         instance.proposal_additional_document_type.additional_document_type.name,
         filename,
     )
@@ -161,7 +162,17 @@ class AdditionalDocumentType(RevisionedMixin):
         ordering = ["name"]
 
 
+class DeletableDocumentQueryset(models.QuerySet):
+    """Makes a bulk .delete skip the documents that can no longer be deleted, the same
+    as deleting each document does, and removes the rest in a single statement.
+    """
+
+    def delete(self):
+        return super(DeletableDocumentQueryset, self.filter(can_delete=True)).delete()
+
+
 class DefaultDocument(Document):
+    objects = DeletableDocumentQueryset.as_manager()
     input_name = models.CharField(max_length=255, null=True, blank=True)
     can_delete = models.BooleanField(
         default=True
@@ -185,6 +196,26 @@ class DefaultDocument(Document):
         )
 
 
+class ProposalDocumentBase(Document):
+    """The fields shared by the documents uploaded to the sections of a proposal"""
+
+    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
+    input_name = models.CharField(max_length=255, null=True, blank=True)
+    can_delete = models.BooleanField(
+        default=True
+    )  # after initial submit prevent document from being deleted
+    can_hide = models.BooleanField(
+        default=False
+    )  # after initial submit, document cannot be deleted but can be hidden
+    hidden = models.BooleanField(
+        default=False
+    )  # after initial submit prevent document from being deleted
+
+    class Meta:
+        app_label = "leaseslicensing"
+        abstract = True
+
+
 class ShapefileDocumentQueryset(models.QuerySet):
     """Using a custom manager to make sure shapfiles are removed when a bulk .delete is called
     as having multiple files with the shapefile extensions in the same folder causes issues.
@@ -228,629 +259,310 @@ class ShapefileDocument(Document):
         app_label = "leaseslicensing"
 
 
-class DeedPollDocument(Document):
+class DeedPollDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="deed_poll_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Deed Poll Document"
 
 
-class LegislativeRequirementsDocument(Document):
+class LegislativeRequirementsDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal",
         related_name="legislative_requirements_documents",
         on_delete=models.CASCADE,
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class RiskFactorsDocument(Document):
+class RiskFactorsDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="risk_factors_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class KeyMilestonesDocument(Document):
+class KeyMilestonesDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="key_milestones_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class KeyPersonnelDocument(Document):
+class KeyPersonnelDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="key_personnel_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class StaffingDocument(Document):
+class StaffingDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="staffing_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class MarketAnalysisDocument(Document):
+class MarketAnalysisDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="market_analysis_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class AvailableActivitiesDocument(Document):
+class AvailableActivitiesDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal",
         related_name="available_activities_documents",
         on_delete=models.CASCADE,
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class FinancialCapacityDocument(Document):
+class FinancialCapacityDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal",
         related_name="financial_capacity_documents",
         on_delete=models.CASCADE,
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class CapitalInvestmentDocument(Document):
+class CapitalInvestmentDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal",
         related_name="capital_investment_documents",
         on_delete=models.CASCADE,
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class CashFlowDocument(Document):
+class CashFlowDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="cash_flow_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class ProfitAndLossDocument(Document):
+class ProfitAndLossDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="profit_and_loss_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class MiningTenementDocument(Document):
+class MiningTenementDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="mining_tenement_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class NativeTitleConsultationDocument(Document):
+class NativeTitleConsultationDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal",
         related_name="native_title_consultation_documents",
         on_delete=models.CASCADE,
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class AboriginalSiteDocument(Document):
+class AboriginalSiteDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="aboriginal_site_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class SignificantChangeDocument(Document):
+class SignificantChangeDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal",
         related_name="significant_change_documents",
         on_delete=models.CASCADE,
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class BuildingRequiredDocument(Document):
+class BuildingRequiredDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="building_required_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class WetlandsImpactDocument(Document):
+class WetlandsImpactDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="wetlands_impact_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class EnvironmentallySensitiveDocument(Document):
+class EnvironmentallySensitiveDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal",
         related_name="environmentally_sensitive_documents",
         on_delete=models.CASCADE,
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class HeritageSiteDocument(Document):
+class HeritageSiteDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="heritage_site_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class GroundDisturbingWorksDocument(Document):
+class GroundDisturbingWorksDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal",
         related_name="ground_disturbing_works_documents",
         on_delete=models.CASCADE,
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class ClearingVegetationDocument(Document):
+class ClearingVegetationDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal",
         related_name="clearing_vegetation_documents",
         on_delete=models.CASCADE,
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class ConsistentPlanDocument(Document):
+class ConsistentPlanDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="consistent_plan_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class ConsistentPurposeDocument(Document):
+class ConsistentPurposeDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal",
         related_name="consistent_purpose_documents",
         on_delete=models.CASCADE,
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class LongTermUseDocument(Document):
+class LongTermUseDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="long_term_use_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class ExclusiveUseDocument(Document):
+class ExclusiveUseDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="exclusive_use_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Application Document"
 
 
-class ProposedDeclineDocument(Document):
+class ProposedDeclineDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="proposed_decline_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Proposed Decline Document"
 
 
-class ProposedApprovalDocument(Document):
+class ProposedApprovalDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="proposed_approval_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
         verbose_name = "Proposed Approval Document"
 
 
-class ProposalDocument(Document):
+class ProposalDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal", related_name="supporting_documents", on_delete=models.CASCADE
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
@@ -858,6 +570,7 @@ class ProposalDocument(Document):
 
 
 class ReferralDocument(Document):
+    objects = DeletableDocumentQueryset.as_manager()
     referral = models.ForeignKey(
         "Referral", related_name="referral_documents", on_delete=models.CASCADE
     )
@@ -869,7 +582,7 @@ class ReferralDocument(Document):
 
     def delete(self):
         if self.can_delete:
-            return super(ProposalDocument, self).delete()
+            return super().delete()
         logger.info(
             "Cannot delete existing document object after Application has been submitted "
             "(including document submitted before Application pushback to status Draft): {}".format(
@@ -882,6 +595,7 @@ class ReferralDocument(Document):
 
 
 class RequirementDocument(Document):
+    objects = DeletableDocumentQueryset.as_manager()
     requirement = models.ForeignKey(
         "ProposalRequirement",
         related_name="requirement_documents",
@@ -901,7 +615,7 @@ class RequirementDocument(Document):
             return super().delete()
 
 
-class LeaseLicenceApprovalDocument(Document):
+class LeaseLicenceApprovalDocument(ProposalDocumentBase):
     proposal = models.ForeignKey(
         "Proposal",
         related_name="lease_licence_approval_documents",
@@ -917,17 +631,6 @@ class LeaseLicenceApprovalDocument(Document):
         related_name="lease_licence_approval_documents",
         on_delete=models.CASCADE,
     )
-    _file = SecureFileField(upload_to=update_proposal_doc_filename, max_length=512)
-    input_name = models.CharField(max_length=255, null=True, blank=True)
-    can_delete = models.BooleanField(
-        default=True
-    )  # after initial submit prevent document from being deleted
-    can_hide = models.BooleanField(
-        default=False
-    )  # after initial submit, document cannot be deleted but can be hidden
-    hidden = models.BooleanField(
-        default=False
-    )  # after initial submit prevent document from being deleted
 
     class Meta:
         app_label = "leaseslicensing"
@@ -943,7 +646,7 @@ class ProposalApplicantDetails(models.Model):
 
 class ProposalType(models.Model):
     # class ProposalType(RevisionedMixin):
-    code = models.CharField(max_length=30, blank=True, null=True)
+    code = models.CharField(max_length=30, blank=True, null=True, db_index=True)
     description = models.CharField(max_length=200, blank=True, null=True)
 
     def __str__(self):
@@ -954,7 +657,19 @@ class ProposalType(models.Model):
         app_label = "leaseslicensing"
 
 
-class ProposalManager(models.Manager):
+class ProposalQuerySet(models.QuerySet):
+    def with_related(self):
+        """Loads the relations read when serializing a list of proposals so each
+        row doesn't run its own queries for them"""
+        return self.prefetch_related("groups__group", "proposalapplicant_set")
+
+    def with_detail(self):
+        """Loads the one to one relations the internal proposal details page serializes
+        along with the proposal"""
+        return self.select_related("invoicing_details", "proposaldeclineddetails")
+
+
+class ProposalManager(models.Manager.from_queryset(ProposalQuerySet)):
     def get_queryset(self):
         return (
             super()
@@ -1012,31 +727,46 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
     )
 
     # List of statuses from above that allow a customer to edit a proposal.
-    CUSTOMER_EDITABLE_STATE = [
-        PROCESSING_STATUS_DRAFT,
-        PROCESSING_STATUS_AMENDMENT_REQUIRED,
-    ]
+    CUSTOMER_EDITABLE_STATE = frozenset(
+        [
+            PROCESSING_STATUS_DRAFT,
+            PROCESSING_STATUS_AMENDMENT_REQUIRED,
+        ]
+    )
 
     # List of statuses from above that allow a customer to view a proposal (read-only)
-    CUSTOMER_VIEWABLE_STATE = [
-        PROCESSING_STATUS_WITH_ASSESSOR,
-        PROCESSING_STATUS_WITH_ASSESSOR_CONDITIONS,
-        PROCESSING_STATUS_WITH_REFERRAL,
-        PROCESSING_STATUS_WITH_APPROVER,
-        PROCESSING_STATUS_APPROVED_REGISTRATION_OF_INTEREST,
-        PROCESSING_STATUS_APPROVED_COMPETITIVE_PROCESS,
-        PROCESSING_STATUS_APPROVED_EDITING_INVOICING,
-        PROCESSING_STATUS_APPROVED,
-        PROCESSING_STATUS_DECLINED,
-        PROCESSING_STATUS_DISCARDED,
-    ]
+    CUSTOMER_VIEWABLE_STATE = frozenset(
+        [
+            PROCESSING_STATUS_WITH_ASSESSOR,
+            PROCESSING_STATUS_WITH_ASSESSOR_CONDITIONS,
+            PROCESSING_STATUS_WITH_REFERRAL,
+            PROCESSING_STATUS_WITH_APPROVER,
+            PROCESSING_STATUS_APPROVED_REGISTRATION_OF_INTEREST,
+            PROCESSING_STATUS_APPROVED_COMPETITIVE_PROCESS,
+            PROCESSING_STATUS_APPROVED_EDITING_INVOICING,
+            PROCESSING_STATUS_APPROVED,
+            PROCESSING_STATUS_DECLINED,
+            PROCESSING_STATUS_DISCARDED,
+        ]
+    )
 
-    OFFICER_PROCESSABLE_STATE = [
-        PROCESSING_STATUS_WITH_ASSESSOR,
-        PROCESSING_STATUS_WITH_ASSESSOR_CONDITIONS,
-        PROCESSING_STATUS_WITH_REFERRAL,  # <-- Be aware
-        PROCESSING_STATUS_WITH_APPROVER,
-    ]
+    OFFICER_PROCESSABLE_STATE = frozenset(
+        [
+            PROCESSING_STATUS_WITH_ASSESSOR,
+            PROCESSING_STATUS_WITH_ASSESSOR_CONDITIONS,
+            PROCESSING_STATUS_WITH_REFERRAL,  # <-- Be aware
+            PROCESSING_STATUS_WITH_APPROVER,
+        ]
+    )
+
+    # Statuses in which the assessor group can assess a proposal
+    ASSESSOR_ASSESSABLE_STATE = frozenset(
+        [
+            PROCESSING_STATUS_WITH_ASSESSOR,
+            PROCESSING_STATUS_WITH_ASSESSOR_CONDITIONS,
+            PROCESSING_STATUS_WITH_REFERRAL,
+        ]
+    )
 
     ID_CHECK_STATUS_CHOICES = (
         ("not_checked", "Not Checked"),
@@ -1241,12 +971,26 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
         app_label = "leaseslicensing"
         verbose_name = "Proposal"
         verbose_name_plural = "Proposals"
+        indexes = [
+            # The applicant columns are or'ed together to find the proposals of a
+            # customer (get_proposals_for_emailuser)
+            models.Index(fields=["submitter"], name="proposal_submitter_idx"),
+            models.Index(fields=["ind_applicant"], name="proposal_ind_applicant_idx"),
+            models.Index(
+                fields=["proxy_applicant"], name="proposal_proxy_applicant_idx"
+            ),
+            models.Index(
+                fields=["processing_status"], name="proposal_processing_status_idx"
+            ),
+        ]
 
     def save(self, *args, **kwargs):
-        # Clear out the cached
-        cache.delete(settings.CACHE_KEY_MAP_PROPOSALS)
+        # Clear out the cached map proposals once the changes have been committed
+        transaction.on_commit(lambda: cache.delete(settings.CACHE_KEY_MAP_PROPOSALS))
+        # Checking the pk rather than _state.adding also covers copies saved with pk=None
+        is_new = self.pk is None
         super().save(*args, **kwargs)
-        if not ProposalAssessment.objects.filter(proposal=self).exists():
+        if is_new:
             # Make sure every proposal has an assessment object
             ProposalAssessment.objects.create(proposal=self)
 
@@ -1282,23 +1026,21 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
 
     @property
     def reversion_ids(self):
-        current_revision_id = Version.objects.get_for_object(self).first().revision_id
-        versions = (
-            Version.objects.get_for_object(self)
-            .select_related("revision__user")
-            .filter(
+        versions = Version.objects.get_for_object(self)
+        # The latest version is always included, fetched as a subquery of the same query
+        version_ids = list(
+            versions.filter(
                 Q(revision__comment__icontains="status")
-                | Q(revision_id=current_revision_id)
-            )
+                | Q(pk=Subquery(versions.values("pk")[:1]))
+            ).values_list("id", "revision__date_created")
         )
-        version_ids = [[i.id, i.revision.date_created] for i in versions]
         return [
             dict(
                 cur_version_id=version_ids[0][0],
-                prev_version_id=version_ids[i + 1][0],
-                created=version_ids[i][1],
+                prev_version_id=previous[0],
+                created=current[1],
             )
-            for i in range(len(version_ids) - 1)
+            for current, previous in zip(version_ids, version_ids[1:])
         ]
 
     @property
@@ -1383,7 +1125,7 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
 
     @property
     def applicant_type(self):
-        if self.org_applicant:
+        if self.org_applicant_id:
             return self.APPLICANT_TYPE_ORGANISATION
         elif self.ind_applicant:
             return self.APPLICANT_TYPE_INDIVIDUAL
@@ -1394,7 +1136,7 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
 
     @property
     def applicant_field(self):
-        if self.org_applicant:
+        if self.org_applicant_id:
             return "org_applicant"
         elif self.ind_applicant:
             return "ind_applicant"
@@ -1404,32 +1146,38 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
             return "submitter"
 
     def qa_officers(self, name=None):
-        if not name:
-            return (
-                QAOfficerGroup.objects.get(default=True)
-                .members.all()
-                .values_list("email", flat=True)
-            )
-        else:
-            return (
-                QAOfficerGroup.objects.get(name=name)
-                .members.all()
-                .values_list("email", flat=True)
-            )
+        # The members of a QA officer group are stored as an array of email user ids
+        filters = {"name": name} if name else {"default": True}
+        member_ids = (
+            QAOfficerGroup.objects.filter(**filters)
+            .values_list("members", flat=True)
+            .first()
+        )
+        return [
+            email_user.email for email_user in retrieve_email_users(member_ids or [])
+        ]
 
     @property
     def get_history(self):
         """Return the prev proposal versions"""
         history_list = []
-        p = copy.deepcopy(self)
-        while p.previous_application:
+        # Only read the columns needed from each previous version of the chain
+        previous_application_id = self.previous_application_id
+        while previous_application_id:
+            previous_application = (
+                Proposal.objects.filter(id=previous_application_id)
+                .values("modified_date", "previous_application_id")
+                .first()
+            )
+            if not previous_application:
+                break
             history_list.append(
                 dict(
-                    id=p.previous_application.id,
-                    modified=p.previous_application.modified_date,
+                    id=previous_application_id,
+                    modified=previous_application["modified_date"],
                 )
             )
-            p = p.previous_application
+            previous_application_id = previous_application["previous_application_id"]
         return history_list
 
     @property
@@ -1493,8 +1241,7 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
 
     @property
     def assessor_assessment(self):
-        qs = self.assessment.filter(referral=None)
-        return qs[0] if qs else None
+        return self.assessment.filter(referral=None).first()
 
     @property
     def referral_assessments(self):
@@ -1507,27 +1254,22 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
 
     @property
     def allowed_assessors(self):
-        group = None
+        group_name = None
         if self.processing_status in [
             Proposal.PROCESSING_STATUS_WITH_APPROVER,
         ]:
-            group = self.get_approver_group()
+            group_name = GROUP_NAME_APPROVER
         elif self.processing_status in [
             Proposal.PROCESSING_STATUS_WITH_REFERRAL,
             Proposal.PROCESSING_STATUS_WITH_ASSESSOR,
             Proposal.PROCESSING_STATUS_WITH_ASSESSOR_CONDITIONS,
         ]:
-            group = self.get_assessor_group()
+            group_name = GROUP_NAME_ASSESSOR
 
-        if not group:
+        if not group_name:
             return []
 
-        emailusers = []
-        for id in group.get_system_group_member_ids():
-            emailuser = retrieve_email_user(id)
-            emailusers.append(emailuser)
-
-        return emailusers
+        return retrieve_email_users(user_ids_in_group(group_name))
 
     @property
     def allowed_approvers(self):
@@ -1537,16 +1279,12 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
     def compliance_assessors(self):
         # group = self.get_assessor_group()
         # return group.members if group else []
-        return self.get_assessor_group().get_system_group_member_ids()
+        return user_ids_in_group(GROUP_NAME_ASSESSOR)
 
     @property
     def can_officer_process(self):
         """:return: True if the proposal is in one of the processable status for Assessor role."""
-        return (
-            True
-            if self.processing_status in Proposal.OFFICER_PROCESSABLE_STATE
-            else True
-        )
+        return self.processing_status in Proposal.OFFICER_PROCESSABLE_STATE
 
     @property
     def amendment_requests(self):
@@ -1556,16 +1294,16 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
     # Check if there is an pending amendment request exist for the proposal
     @property
     def pending_amendment_request(self):
-        qs = AmendmentRequest.objects.filter(proposal=self, status="requested")
-        if qs:
-            return True
-        return False
+        return AmendmentRequest.objects.filter(
+            proposal=self, status="requested"
+        ).exists()
 
     @property
     def is_amendment_proposal(self):
-        if self.proposal_type == ProposalType.objects.get(code=PROPOSAL_TYPE_AMENDMENT):
-            return True
-        return False
+        return (
+            self.proposal_type is not None
+            and self.proposal_type.code == PROPOSAL_TYPE_AMENDMENT
+        )
 
     @property
     def additional_documents(self):
@@ -1573,13 +1311,13 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
             proposal_additional_document_type__proposal=self
         )
 
-    @property
+    @cached_property
     def additional_documents_missing(self):
         # Check if the proposal has all the required additional documents
-        return (
-            self.additional_document_types.filter(document__isnull=True)
-            .annotate(name=F("additional_document_type__name"))
-            .values("name")
+        return list(
+            self.additional_document_types.filter(document__isnull=True).values(
+                name=F("additional_document_type__name")
+            )
         )
 
     def get_assessor_group(self):
@@ -1602,48 +1340,34 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
     @property
     def assessor_recipients(self):
         logger.info("assessor_recipients")
-        recipients = []
-        group_ids = self.get_assessor_group().get_system_group_member_ids()
-        for id in group_ids:
-            logger.info(id)
-            recipient = retrieve_email_user(id)
-            recipients.append(recipient.email)
-        return recipients
+        group_ids = user_ids_in_group(GROUP_NAME_ASSESSOR)
+        return [recipient.email for recipient in retrieve_email_users(group_ids)]
 
     @property
     def approver_recipients(self):
         logger.info("approver_recipients")
-        recipients = []
-        group_ids = self.get_approver_group().get_system_group_member_ids()
-        for id in group_ids:
-            logger.info(id)
-            recipient = retrieve_email_user(id)
-            recipients.append(recipient.email)
-        return recipients
+        group_ids = user_ids_in_group(GROUP_NAME_APPROVER)
+        return [recipient.email for recipient in retrieve_email_users(group_ids)]
 
     # Check if the user is member of assessor group for the Proposal
     def is_assessor(self, user):
-        return user.id in self.get_assessor_group().get_system_group_member_ids()
+        return user.id in user_ids_in_group(GROUP_NAME_ASSESSOR)
 
-    # Check if the user is member of assessor group for the Proposal
+    # Check if the user is member of approver group for the Proposal
     def is_approver(self, user):
-        return user.id in self.get_assessor_group().get_system_group_member_ids()
+        return user.id in user_ids_in_group(GROUP_NAME_APPROVER)
 
     def can_action(self, user):
         if not self.can_assess(user):
             return False
 
     def can_assess(self, user):
-        if self.processing_status in [
-            Proposal.PROCESSING_STATUS_WITH_ASSESSOR,
-            Proposal.PROCESSING_STATUS_WITH_ASSESSOR_CONDITIONS,
-            Proposal.PROCESSING_STATUS_WITH_REFERRAL,
-        ]:
+        if self.processing_status in Proposal.ASSESSOR_ASSESSABLE_STATE:
             logger.info("self.__assessor_group().get_system_group_member_ids()")
-            logger.info(self.get_assessor_group().get_system_group_member_ids())
-            return user.id in self.get_assessor_group().get_system_group_member_ids()
+            logger.info(user_ids_in_group(GROUP_NAME_ASSESSOR))
+            return user.id in user_ids_in_group(GROUP_NAME_ASSESSOR)
         elif self.processing_status == Proposal.PROCESSING_STATUS_WITH_APPROVER:
-            return user.id in self.get_approver_group().get_system_group_member_ids()
+            return user.id in user_ids_in_group(GROUP_NAME_APPROVER)
         else:
             return False
 
@@ -1665,25 +1389,23 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
         Returns whether `user` is a referrer who can still edit this proposal's referral
         """
 
-        if self.is_referee(user):
-            # Get this proposal's referral where the requesting user is the referee
-            try:
-                referral = Referral.objects.get(proposal=self, referral=user.id)
-            except Referral.DoesNotExist:
-                logger.warning(
-                    f"Referral with Proposal: {self} and referral user id: {user.id} does not exist"
-                )
-                return False
-
-            if referral.processing_status in [
-                Referral.PROCESSING_STATUS_COMPLETED,
-                Referral.PROCESSING_STATUS_RECALLED,
-            ]:
-                return False
+        if self.processing_status != self.PROCESSING_STATUS_WITH_REFERRAL:
+            return False
 
-            return True
+        # Get the status of this proposal's referral where the requesting user is the
+        # referee (doubles as the is_referee check)
+        referral_processing_status = (
+            Referral.objects.filter(proposal=self, referral=user.id)
+            .values_list("processing_status", flat=True)
+            .first()
+        )
+        if referral_processing_status is None:
+            return False
 
-        return False
+        return referral_processing_status not in [
+            Referral.PROCESSING_STATUS_COMPLETED,
+            Referral.PROCESSING_STATUS_RECALLED,
+        ]
 
     def can_edit_period(self, user):
         if (
@@ -1692,7 +1414,7 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
             == Proposal.PROCESSING_STATUS_WITH_ASSESSOR_CONDITIONS
         ):
             # return self.__assessor_group() in user.proposalassessorgroup_set.all()
-            return user.id in self.get_assessor_group().get_system_group_member_ids()
+            return user.id in user_ids_in_group(GROUP_NAME_ASSESSOR)
         else:
             return False
 
@@ -1710,9 +1432,9 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
                 referral = None
             if referral:
                 return True
-            elif user.id in self.get_assessor_group().get_system_group_member_ids():
+            elif user.id in user_ids_in_group(GROUP_NAME_ASSESSOR):
                 return True
-            elif user.id in self.get_approver_group().get_system_group_member_ids():
+            elif user.id in user_ids_in_group(GROUP_NAME_APPROVER):
                 return True
             else:
                 return False
@@ -1733,17 +1455,12 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
             if self.assigned_officer:
                 if self.assigned_officer == user.id:
                     # return self.__assessor_group() in user.proposalassessorgroup_set.all()
-                    return (
-                        user.id
-                        in self.get_assessor_group().get_system_group_member_ids()
-                    )
+                    return user.id in user_ids_in_group(GROUP_NAME_ASSESSOR)
                 else:
                     return False
             else:
                 # return self.__assessor_group() in user.proposalassessorgroup_set.all()
-                return (
-                    user.id in self.get_assessor_group().get_system_group_member_ids()
-                )
+                return user.id in user_ids_in_group(GROUP_NAME_ASSESSOR)
 
     def log_user_action(self, action, request):
         return ProposalUserAction.log_action(self, action, request.user.id)
@@ -3314,9 +3031,12 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
             )
             return None
 
-        try:
-            proposal_applicant = ProposalApplicant.objects.get(proposal=self)
-        except ProposalApplicant.DoesNotExist:
+        # Read through the reverse relation so the applicants prefetched by
+        # with_related are used
+        proposal_applicants = sorted(
+            self.proposalapplicant_set.all(), key=lambda applicant: applicant.id
+        )
+        if not proposal_applicants:
             from leaseslicensing.components.proposals.utils import (
                 make_proposal_applicant_ready,
             )
@@ -3326,14 +3046,13 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
             )
             emailuser = EmailUser.objects.get(id=self.ind_applicant)
             make_proposal_applicant_ready(self, emailuser)
-            proposal_applicant = ProposalApplicant.objects.get(proposal=self)
-        except ProposalApplicant.MultipleObjectsReturned:
+            return ProposalApplicant.objects.get(proposal=self)
+
+        if len(proposal_applicants) > 1:
             logger.warning(
                 f"Multiple ProposalApplicants found for Proposal: {self}. Using the first one."
             )
-            proposal_applicant = ProposalApplicant.objects.filter(proposal=self).first()
-
-        return proposal_applicant
+        return proposal_applicants[0]
 
     @transaction.atomic
     def renew_approval(self, request):
@@ -3872,7 +3591,7 @@ class Proposal(LicensingModelVersioned, DirtyFieldsMixin):
         if not settings.DEBUG:
             raise ValidationError("This method is only available in DEBUG mode.")
         for proposal in cls.objects.all():
-            print(proposal)
+            logger.info(f"Purging {proposal}")
             proposal.purge_proposal()
 
 
@@ -4588,6 +4307,12 @@ class Referral(RevisionedMixin):
     class Meta:
         app_label = "leaseslicensing"
         ordering = ("-lodged_on",)
+        indexes = [
+            # Serves the referrals of a proposal in their default order (latest_referrals)
+            models.Index(
+                fields=["proposal", "-lodged_on"], name="referral_proposal_lodged_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"Referral: {self.id} for Proposal: {self.proposal.lodgement_number}"
@@ -4606,11 +4331,7 @@ class Referral(RevisionedMixin):
     @property
     def referral_assessment(self):
         # qs=self.assessment.filter(referral_assessment=True, referral_group=self.referral_group)
-        qs = self.assessment.filter(referral_assessment=True)
-        if qs:
-            return qs[0]
-        else:
-            return None
+        return self.assessment.filter(referral_assessment=True).first()
 
     @property
     def can_be_completed(self):
@@ -5318,6 +5039,18 @@ def clone_proposal_with_status_reset(original_proposal):
         return cloned_proposal
 
 
+def _copy_proposal_media_dir(proposal, original_proposal, media_prefix):
+    # Copied in process (preserving timestamps like cp -p) rather than shelling out
+    media_dir = f"{media_prefix}/{settings.MEDIA_APP_DIR}"
+    original_proposal_dir = f"{media_dir}/proposals/{original_proposal.id}"
+    if os.path.isdir(original_proposal_dir):
+        shutil.copytree(
+            original_proposal_dir,
+            f"{media_dir}/proposals/{proposal.id}",
+            dirs_exist_ok=True,
+        )
+
+
 def clone_documents(proposal, original_proposal, media_prefix):
     for proposal_document in ProposalDocument.objects.filter(proposal_id=proposal.id):
         proposal_document._file.name = "proposals/{}/documents/{}".format(
@@ -5357,13 +5090,7 @@ def clone_documents(proposal, original_proposal, media_prefix):
 
     # copy documents on file system and reset can_delete flag
     # Not 100% sure this will work after implementing the secure file storage
-    media_dir = f"{media_prefix}/{settings.MEDIA_APP_DIR}"
-    subprocess.call(
-        "cp -pr {0}/proposals/{1} {0}/proposals/{2}".format(
-            media_dir, original_proposal.id, proposal.id
-        ),
-        shell=True,
-    )
+    _copy_proposal_media_dir(proposal, original_proposal, media_prefix)
 
 
 def _clone_documents(proposal, original_proposal, media_prefix):
@@ -5380,13 +5107,7 @@ def _clone_documents(proposal, original_proposal, media_prefix):
 
     # copy documents on file system and reset can_delete flag
     # Not 100% sure this will work after implementing the secure file storage
-    media_dir = f"{media_prefix}/{settings.MEDIA_APP_DIR}"
-    subprocess.call(
-        "cp -pr {0}/proposals/{1} {0}/proposals/{2}".format(
-            media_dir, original_proposal.id, proposal.id
-        ),
-        shell=True,
-    )
+    _copy_proposal_media_dir(proposal, original_proposal, media_prefix)
 
 
 def search_reference(reference_number):
@@ -6,7 +6,6 @@ from django.db.models import Q
 from django.urls import reverse
 from django.utils.translation import gettext as _
 from ledger_api_client.ledger_models import EmailUserRO as EmailUser
-from ledger_api_client.managed_models import SystemGroup
 from rest_framework import serializers
 from rest_framework_gis.serializers import GeoFeatureModelSerializer
 
@@ -58,7 +57,6 @@ from leaseslicensing.components.tenure.models import (
     Act,
     Category,
     District,
-    Group,
     Identifier,
     Name,
     Region,
@@ -76,6 +74,7 @@ from leaseslicensing.helpers import (
     is_finance_officer,
     is_internal,
     is_referee,
+    user_ids_in_group,
 )
 from leaseslicensing.ledger_api_utils import retrieve_email_user
 from leaseslicensing.settings import GROUP_NAME_CHOICES
@@ -635,9 +634,16 @@ class BaseProposalSerializer(serializers.ModelSerializer):
                 )
 
     def get_groups(self, obj):
-        group_ids = obj.groups.values_list("group__id", flat=True)
-        group_qs = Group.objects.filter(id__in=group_ids).values("id", "name")
-        return GroupSerializer(group_qs, many=True).data
+        # Read through the proposal groups so the prefetch of the proposal lists
+        # (see ProposalQuerySet.with_related) is used, otherwise join the groups
+        proposal_groups = obj.groups.all()
+        if "groups" not in getattr(obj, "_prefetched_objects_cache", {}):
+            proposal_groups = proposal_groups.select_related("group")
+        groups = sorted(
+            (proposal_group.group for proposal_group in proposal_groups),
+            key=lambda group: group.name,
+        )
+        return GroupSerializer(groups, many=True).data
 
     def get_lodgement_date_display(self, obj):
         if obj.lodgement_date:
@@ -695,10 +701,8 @@ class BaseProposalSerializer(serializers.ModelSerializer):
         roles = []
 
         for choice in GROUP_NAME_CHOICES:
-            group = SystemGroup.objects.get(name=choice[0])
-            ids = group.get_system_group_member_ids()
-            if accessing_user.id in ids:
-                roles.append(group.name)
+            if accessing_user.id in user_ids_in_group(choice[0]):
+                roles.append(choice[0])
 
         referral_ids = list(proposal.referrals.values_list("referral", flat=True))
         if accessing_user.id in referral_ids:
@@ -908,12 +912,12 @@ class ListProposalSerializer(BaseProposalSerializer):
             Proposal.PROCESSING_STATUS_WITH_ASSESSOR,
             Proposal.PROCESSING_STATUS_WITH_ASSESSOR_CONDITIONS,
         ]:
-            if user.id in proposal.get_assessor_group().get_system_group_member_ids():
+            if user.id in user_ids_in_group(settings.GROUP_NAME_ASSESSOR):
                 accessing_user_can_process = True
         elif proposal.processing_status in [
             Proposal.PROCESSING_STATUS_WITH_APPROVER,
         ]:
-            if user.id in proposal.get_approver_group().get_system_group_member_ids():
+            if user.id in user_ids_in_group(settings.GROUP_NAME_APPROVER):
                 accessing_user_can_process = True
         elif proposal.processing_status in [
             Proposal.PROCESSING_STATUS_WITH_REFERRAL,
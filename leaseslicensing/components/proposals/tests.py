@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase
+
+from leaseslicensing.components.proposals.models import Proposal, QAOfficerGroup
+
+
+class ProposalQAOfficersTestCase(TestCase):
+    def setUp(self):
+        QAOfficerGroup.objects.create(name="Default", members=[1, 2], default=True)
+        QAOfficerGroup.objects.create(name="Other", members=[3])
+
+    def qa_officers(self, *args):
+        with mock.patch(
+            "leaseslicensing.components.proposals.models.retrieve_email_users",
+            side_effect=lambda user_ids: [
+                SimpleNamespace(id=user_id, email=f"user{user_id}@example.com")
+                for user_id in user_ids
+            ],
+        ):
+            return Proposal().qa_officers(*args)
+
+    def test_qa_officers_of_default_group(self):
+        self.assertEqual(self.qa_officers(), ["user1@example.com", "user2@example.com"])
+
+    def test_qa_officers_of_named_group(self):
+        self.assertEqual(self.qa_officers("Other"), ["user3@example.com"])
+
+    def test_qa_officers_of_missing_group(self):
+        self.assertEqual(self.qa_officers("Missing"), [])
+
+
+class ProposalIsApproverTestCase(SimpleTestCase):
+    def setUp(self):
+        group_member_ids = {
+            settings.GROUP_NAME_ASSESSOR: [1],
+            settings.GROUP_NAME_APPROVER: [2],
+        }
+        patcher = mock.patch(
+            "leaseslicensing.components.proposals.models.user_ids_in_group",
+            side_effect=lambda group_name: group_member_ids[group_name],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_approver_is_approver(self):
+        self.assertTrue(Proposal().is_approver(SimpleNamespace(id=2)))
+
+    def test_assessor_is_not_approver(self):
+        self.assertFalse(Proposal().is_approver(SimpleNamespace(id=1)))
+
+
+class ProposalCanOfficerProcessTestCase(SimpleTestCase):
+    def test_processable_statuses(self):
+        for processing_status in Proposal.OFFICER_PROCESSABLE_STATE:
+            with self.subTest(processing_status=processing_status):
+                proposal = Proposal(processing_status=processing_status)
+                self.assertTrue(proposal.can_officer_process)
+
+    def test_unprocessable_statuses(self):
+        for processing_status in [
+            Proposal.PROCESSING_STATUS_DRAFT,
+            Proposal.PROCESSING_STATUS_APPROVED,
+            Proposal.PROCESSING_STATUS_DECLINED,
+            Proposal.PROCESSING_STATUS_DISCARDED,
+        ]:
+            with self.subTest(processing_status=processing_status):
+                proposal = Proposal(processing_status=processing_status)
+                self.assertFalse(proposal.can_officer_process)
@@ -355,7 +355,9 @@ class UserViewSet(UserActionLoggingViewset):
     @basic_exception_handler
     def comms_log(self, request, *args, **kwargs):
         instance = self.get_object()
-        qs = EmailUserLogEntry.objects.filter(email_user=instance.id)
+        qs = EmailUserLogEntry.objects.filter(email_user=instance.id).prefetch_related(
+            "documents"
+        )
         serializer = EmailUserLogEntrySerializer(qs, many=True)
         return Response(serializer.data)
 
@@ -1,7 +1,11 @@
 import logging
 
+from django.conf import settings
 from django.contrib.auth.signals import user_logged_in
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from ledger_api_client.managed_models import SystemGroupPermission
 
 from leaseslicensing.components.proposals.models import ExternalRefereeInvite, Referral
 
@@ -43,3 +47,16 @@ def process_external_referee_invite(sender, user, request, **kwargs):
 
 
 user_logged_in.connect(process_external_referee_invite)
+
+
+def clear_system_group_member_ids(sender, instance, **kwargs):
+    """
+    Clear the cached member ids of a group whenever one of its memberships changes.
+    """
+    cache.delete(
+        settings.CACHE_KEY_SYSTEM_GROUP_MEMBER_IDS.format(instance.system_group.name)
+    )
+
+
+post_save.connect(clear_system_group_member_ids, sender=SystemGroupPermission)
+post_delete.connect(clear_system_group_member_ids, sender=SystemGroupPermission)
@@ -1,6 +1,7 @@
 import logging
 import re
 from decimal import Decimal
+from functools import lru_cache
 
 from django.apps import apps
 from django.conf import settings
@@ -16,26 +17,43 @@ def today():
     return timezone.localtime(timezone.now()).date()
 
 
+@lru_cache(maxsize=None)
+def gst_fraction_of_total():
+    # The gst rate doesn't change at runtime so only work out the fraction once
+    gst_rate = Decimal(settings.LEDGER_GST).quantize(Decimal("0.01"))
+    return gst_rate / (100 + gst_rate)
+
+
 def gst_from_total(total_inc_gst):
     # Only to be used for totals that include gst
     # as will not return 0.00 for totals that do not include gst
-    gst_rate = Decimal(settings.LEDGER_GST).quantize(Decimal("0.01"))
-    gst = gst_rate / (100 + gst_rate) * total_inc_gst
+    gst = gst_fraction_of_total() * total_inc_gst
     return Decimal(gst).quantize(Decimal("0.01"))
 
 
 def user_ids_in_group(group_name):
-    try:
-        system_group = SystemGroup.objects.get(name=group_name)
-        return system_group.get_system_group_member_ids()
-    except SystemGroup.DoesNotExist:
-        logger.warning(f"SystemGroup {group_name} does not exist.")
-        return []
+    return system_group_member_ids(group_name)
+
+
+def system_group_member_ids(group_name):
+    """Group memberships are checked on most requests but rarely change so the member
+    ids of each group are cached briefly. The cache entry is cleared whenever a
+    membership of the group is saved or deleted (see users.signals)"""
+    cache_key = settings.CACHE_KEY_SYSTEM_GROUP_MEMBER_IDS.format(group_name)
+    member_ids = cache.get(cache_key)
+    if member_ids is None:
+        system_group = SystemGroup.objects.filter(name=group_name).first()
+        if system_group:
+            member_ids = list(system_group.get_system_group_member_ids())
+        else:
+            logger.warning(f"SystemGroup {group_name} does not exist.")
+            member_ids = []
+        cache.set(cache_key, member_ids, settings.CACHE_TIMEOUT_1_MINUTE)
+    return member_ids
 
 
 def belongs_to_by_user_id(user_id, group_name):
-    system_group = SystemGroup.objects.filter(name=group_name).first()
-    return system_group and user_id in system_group.get_system_group_member_ids()
+    return user_id in system_group_member_ids(group_name)
 
 
 def emails_list_for_group(group_name):
@@ -51,7 +69,19 @@ def belongs_to(request, group_name):
     if request.user.is_superuser:
         return True
 
-    return belongs_to_by_user_id(request.user.id, group_name)
+    # Group membership checks are often made many times per request (e.g. once per row
+    # by a serializer) so the results are memoized on the request object
+    group_memberships = getattr(request, "_group_memberships", None)
+    if group_memberships is None:
+        group_memberships = {}
+        request._group_memberships = group_memberships
+
+    if group_name not in group_memberships:
+        group_memberships[group_name] = belongs_to_by_user_id(
+            request.user.id, group_name
+        )
+
+    return group_memberships[group_name]
 
 
 def is_competitive_process_editor(request):
@@ -1,4 +1,5 @@
 import logging
+import time
 
 from django.conf import settings
 from django.core.cache import cache
@@ -11,10 +12,21 @@ from leaseslicensing.components.main.decorators import (
 
 logger = logging.getLogger(__name__)
 
+# In process memo that sits in front of the (file based) django cache so that the same
+# email user looked up many times in a row (e.g. once per row of a list) is only
+# unpickled once. Entries expire after the same timeout as the django cache entries.
+EMAIL_USER_MEMO_MAX_SIZE = 1024
+_email_user_memo = {}
+
 
 @basic_exception_handler
 @user_notexists_exception_handler
 def retrieve_email_user(email_user_id):
+    now = time.monotonic()
+    memoized = _email_user_memo.get(email_user_id)
+    if memoized and memoized[0] > now:
+        return memoized[1]
+
     cache_key = settings.CACHE_KEY_LEDGER_EMAIL_USER.format(email_user_id)
     email_user = cache.get(cache_key)
     if email_user is None:
@@ -23,9 +35,64 @@ def retrieve_email_user(email_user_id):
         except EmailUser.DoesNotExist:
             return None
         cache.set(cache_key, email_user, settings.CACHE_TIMEOUT_5_SECONDS)
+
+    _memoize_email_user(email_user_id, email_user, now)
     return email_user
 
 
+@basic_exception_handler
+def retrieve_email_users(email_user_ids):
+    """Returns the email users with the given ids (in the same order) skipping any that
+    don't exist. The users that are not already cached are fetched in a single query."""
+    email_user_ids = list(email_user_ids)
+    now = time.monotonic()
+    email_users = {}
+
+    cache_keys = {}
+    for email_user_id in email_user_ids:
+        memoized = _email_user_memo.get(email_user_id)
+        if memoized and memoized[0] > now:
+            email_users[email_user_id] = memoized[1]
+        else:
+            cache_keys[settings.CACHE_KEY_LEDGER_EMAIL_USER.format(email_user_id)] = (
+                email_user_id
+            )
+
+    if cache_keys:
+        cached = cache.get_many(cache_keys.keys())
+        uncached_ids = [
+            email_user_id
+            for cache_key, email_user_id in cache_keys.items()
+            if cache_key not in cached
+        ]
+        fetched = {}
+        if uncached_ids:
+            for email_user in EmailUser.objects.filter(id__in=uncached_ids):
+                fetched[settings.CACHE_KEY_LEDGER_EMAIL_USER.format(email_user.id)] = (
+                    email_user
+                )
+            cache.set_many(fetched, settings.CACHE_TIMEOUT_5_SECONDS)
+
+        for email_user in list(cached.values()) + list(fetched.values()):
+            email_users[email_user.id] = email_user
+            _memoize_email_user(email_user.id, email_user, now)
+
+    return [
+        email_users[email_user_id]
+        for email_user_id in email_user_ids
+        if email_user_id in email_users
+    ]
+
+
+def _memoize_email_user(email_user_id, email_user, now):
+    if len(_email_user_memo) >= EMAIL_USER_MEMO_MAX_SIZE:
+        _email_user_memo.clear()
+    _email_user_memo[email_user_id] = (
+        now + settings.CACHE_TIMEOUT_5_SECONDS,
+        email_user,
+    )
+
+
 def retrieve_default_from_email_user():
     cache_key = settings.CACHE_KEY_DEFAULT_FROM_EMAIL
     default_from_email_user = cache.get(cache_key)
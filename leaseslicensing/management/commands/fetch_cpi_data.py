@@ -20,6 +20,7 @@ CL_FREQ           Q       (Quarterly)
 
 import logging
 import xml.etree.ElementTree as ET
+from decimal import Decimal
 
 import requests
 from django.core.management.base import BaseCommand
@@ -43,6 +44,11 @@ class Command(BaseCommand):
         cpi_data = requests.get(url)
         logger.info(f"Request took: {cpi_data.elapsed.total_seconds()} seconds.")
         root = ET.fromstring(cpi_data.content)
+        # The api returns the full history so read the stored figures in one query
+        # rather than looking each time period up
+        existing_cpi_data = set(
+            ConsumerPriceIndex.objects.values_list("year", "quarter", "value")
+        )
         for node in root[1][0]:
             if node[0].attrib["id"] != "TIME_PERIOD":
                 continue
@@ -51,10 +57,9 @@ class Command(BaseCommand):
             year = time_period.split("-")[0]
             quarter = time_period.split("-")[1].replace("Q", "")
             value = node[1].attrib["value"]
-            cpi, created = ConsumerPriceIndex.objects.get_or_create(
-                year=year, quarter=quarter, value=value
+            if (int(year), int(quarter), Decimal(value)) in existing_cpi_data:
+                continue
+            ConsumerPriceIndex.objects.create(year=year, quarter=quarter, value=value)
+            logger.info(
+                f"Created New CPI Data Record - Time Period: {time_period}, Value: {value}"
             )
-            if created:
-                logger.info(
-                    f"Created New CPI Data Record - Time Period: {time_period}, Value: {value}"
-                )
@@ -1,4 +1,5 @@
 """ Maybe useful for populating proposal applicants from ind_applicants """
+
 import json
 import logging
 
@@ -28,7 +29,10 @@ class Command(BaseCommand):
             return
 
         address_details = {}
-        for proposal in Proposal.objects.all():
+        # Stream the proposals rather than loading the whole table into memory
+        for proposal in Proposal.objects.filter(ind_applicant__isnull=False).iterator(
+            chunk_size=500
+        ):
             ind_applicant = proposal.ind_applicant
             if not ind_applicant:
                 continue
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.12 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaseslicensing', '0326_alter_organisation_ledger_organisation_trading_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organisationcontact',
+            index=models.Index(fields=['organisation', 'user_role', 'user_status'], name='org_contact_role_status_idx'),
+        ),
+    ]
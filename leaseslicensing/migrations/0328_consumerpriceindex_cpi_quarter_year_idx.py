@@ -0,0 +1,17 @@
+# Generated by Django 5.0.12 on 2026-10-16 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaseslicensing', '0327_organisationcontact_org_contact_role_status_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='consumerpriceindex',
+            index=models.Index(fields=['quarter', '-year'], name='cpi_quarter_year_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.12 on 2026-10-16 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaseslicensing', '0328_consumerpriceindex_cpi_quarter_year_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='invoicetransaction',
+            index=models.Index(fields=['invoice', 'datetime_created'], name='invoice_transaction_date_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.12 on 2026-10-16 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaseslicensing', '0329_invoicetransaction_invoice_transaction_date_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='proposaltype',
+            name='code',
+            field=models.CharField(blank=True, db_index=True, max_length=30, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.12 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaseslicensing', '0330_alter_proposaltype_code'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organisationcontact',
+            index=models.Index(fields=['organisation', 'user'], name='org_contact_user_idx'),
+        ),
+    ]
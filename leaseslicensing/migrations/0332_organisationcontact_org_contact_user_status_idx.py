@@ -0,0 +1,17 @@
+# Generated by Django 5.0.12 on 2026-10-16 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaseslicensing', '0331_organisationcontact_org_contact_user_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organisationcontact',
+            index=models.Index(fields=['user', 'user_status'], name='org_contact_user_status_idx'),
+        ),
+    ]
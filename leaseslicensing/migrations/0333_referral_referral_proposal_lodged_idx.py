@@ -0,0 +1,17 @@
+# Generated by Django 5.0.12 on 2026-10-16 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaseslicensing', '0332_organisationcontact_org_contact_user_status_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='referral',
+            index=models.Index(fields=['proposal', '-lodged_on'], name='referral_proposal_lodged_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.12 on 2026-10-16 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leaseslicensing', '0333_referral_referral_proposal_lodged_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['submitter'], name='proposal_submitter_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['ind_applicant'], name='proposal_ind_applicant_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['proxy_applicant'], name='proposal_proxy_applicant_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proposal',
+            index=models.Index(fields=['processing_status'], name='proposal_processing_status_idx'),
+        ),
+    ]
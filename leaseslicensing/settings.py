@@ -649,6 +649,10 @@ CACHE_KEY_DBCA_LEGISLATED_LANDS_AND_WATERS = "dbca_legislated_lands_and_waters"
 CACHE_KEY_MAP_PROPOSALS = "map-proposals"
 CACHE_KEY_LODGEMENT_NUMBER_PREFIXES = "lodgement_number_prefixes"
 CACHE_KEY_APPROVAL_TYPES_DICTIONARY = "approval-types-dictionary"
+CACHE_KEY_CPI_BY_YEAR_AND_QUARTER = "cpi-{}-q{}"
+CACHE_KEY_ORGANISATION_ADMIN_EMAILS = "org-admin-emails-{}"
+CACHE_KEY_SYSTEM_GROUP_MEMBER_IDS = "system-group-member-ids-{}"
+CACHE_KEY_GIS_DATA_FOR_GEOMETRIES = "gis-data-for-geometries-{}"
 
 # ---------- User Log Actions ----------
 